@@ -988,6 +988,9 @@ class AmanuensisApp(App):
                 notes = self.notes_input.text if self.notes_input else ""
                 self.speaker_manager.end_session(self.current_session_id, notes)
 
+            # Write any queued transcript segments and stop the writer thread
+            self.speaker_manager.close()
+
             self.audio_manager.cleanup()
             self.api_manager.cleanup()
             self.config_manager.clear_memory()
@@ -1016,6 +1016,9 @@ Security:
                     notes = ""
                 self.speaker_manager.end_session(self.current_session_id, notes)
 
+            # Write any queued transcript segments and stop the writer thread
+            self.speaker_manager.close()
+
             # Close settings window if open
             if self.settings_window and self.settings_window.window:
                 self.settings_window.close_window()
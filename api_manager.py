@@ -121,15 +121,11 @@ class APIManager:
 
     def format_transcript_for_analysis(self, segments: List[Dict]) -> str:
         """Format transcript segments for Claude analysis"""
-        formatted_lines = []
-
-        for segment in segments:
-            speaker_tag = f"[{segment['speaker']}]"
-            text = segment['text'].strip()
-            if text:
-                formatted_lines.append(f"{speaker_tag}: {text}")
-
-        return "\n".join(formatted_lines)
+        return "\n".join(
+            f"[{segment['speaker']}]: {text}"
+            for segment in segments
+            if (text := segment['text'].strip())
+        )
 
     def analyze_therapy_session(self, transcript: str, session_context: Dict = None) -> Tuple[bool, Dict]:
         """
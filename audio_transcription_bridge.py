@@ -82,12 +82,40 @@ try:
 except ImportError:
     AUDIO_Q_MAX = 32
 
+class _DropOldestQueue(queue.Queue):
+    """Bounded queue whose producer side evicts the oldest packet instead of blocking or failing"""
+
+    def put_overwrite(self, item) -> bool:
+        """Append item under a single lock acquisition; return True if the oldest item was dropped"""
+        with self.mutex:
+            dropped = 0 < self.maxsize <= self._qsize()
+            if dropped:
+                self.queue.popleft()
+            else:
+                self.unfinished_tasks += 1  # The evicted packet's slot is reused, so only count new ones
+            self._put(item)
+            self.not_empty.notify()
+            return dropped
+
+    def drain_nowait(self) -> list:
+        """Remove and return every queued item under a single lock acquisition"""
+        with self.mutex:
+            items = list(self.queue)
+            self.queue.clear()
+            self.not_full.notify_all()
+            return items
+
+
 # Global audio queue for reliable frame delivery
-audio_q = queue.Queue(maxsize=AUDIO_Q_MAX)
+audio_q = _DropOldestQueue(maxsize=AUDIO_Q_MAX)
 _last_drop_log = 0.0
 
 def push_audio_frames(frames: np.ndarray, samplerate: int):
-    """Push audio frames to the bounded queue with overflow handling."""
+    """Push audio frames to the bounded queue with overflow handling.
+
+    float32 frames are queued without a copy, so a caller recycling its buffers must not
+    refill one until the consumer has taken the packet.
+    """
     global _last_drop_log
     
     # Create audio packet with timestamp
@@ -97,35 +125,45 @@ def push_audio_frames(frames: np.ndarray, samplerate: int):
         "data": frames.astype("float32", copy=False)  # audio data
     }
     
-    try:
-        audio_q.put_nowait(pkt)
-    except queue.Full:
-        # Queue is full - drop oldest packet and add new one
-        try:
-            audio_q.get_nowait()  # drop oldest
-        except queue.Empty:
-            pass
-        audio_q.put_nowait(pkt)
-        
+    # When the queue is full the oldest packet is dropped (one lock round-trip either way)
+    if audio_q.put_overwrite(pkt):
         # Log overflow (throttled to once per second)
         if time.time() - _last_drop_log > 1.0:
             logger = get_logger('audio_bridge')
             logger.debug("audio_q overflow: dropping oldest frame")
             _last_drop_log = time.time()
 
+# Loopback microphones by speaker name; soundcard's loopback lookup enumerates every capture device
+_loopback_mics: Dict[str, Any] = {}
+_loopback_lock = threading.Lock()
+
+def clear_loopback_cache():
+    """Forget resolved loopback microphones (after a device change or a failed preflight)."""
+    with _loopback_lock:
+        _loopback_mics.clear()
+
 @com_audio_safe
-def resolve_loopback_mic():
-    """Resolve the loopback microphone for the specified speaker device."""
+def resolve_loopback_mic(device_name: Optional[str] = None):
+    """Resolve the loopback microphone for the specified speaker device.
+
+    device_name overrides the configured loopback device when given.
+    """
     if not SOUNDCARD_AVAILABLE:
         raise ImportError("soundcard module not available")
 
-    device_name = config.get('loopback_device_name')
+    device_name = device_name or config.get('loopback_device_name')
     if device_name:
         spk = sc.get_speaker(device_name)
     else:
         spk = sc.default_speaker()
 
-    mic = sc.get_microphone(id=spk.name, include_loopback=True)
+    # Keyed on the resolved speaker, so a change of default device misses the cache
+    with _loopback_lock:
+        mic = _loopback_mics.get(spk.name)
+    if mic is None:
+        mic = sc.get_microphone(id=spk.name, include_loopback=True)
+        with _loopback_lock:
+            _loopback_mics[spk.name] = mic
     return mic, spk
 
 @com_audio_safe
@@ -137,6 +175,27 @@ def preflight_loopback(mic):
     with mic.recorder(samplerate=samplerate) as rec:
         _ = rec.record(numframes=test_frames)
 
+@com_audio_safe
+def resolve_loopback_mics(speakers) -> Dict[str, Any]:
+    """Resolve loopback microphones for several speakers with a single device enumeration.
+
+    Returns {speaker name: loopback mic}; speakers without a loopback endpoint are left out.
+    """
+    if not SOUNDCARD_AVAILABLE:
+        raise ImportError("soundcard module not available")
+
+    with _loopback_lock:
+        resolved = {spk.name: _loopback_mics[spk.name] for spk in speakers if spk.name in _loopback_mics}
+    missing = {spk.name for spk in speakers} - resolved.keys()
+    if missing:
+        for mic in sc.all_microphones(include_loopback=True):
+            if mic.name in missing and getattr(mic, 'isloopback', True):
+                resolved[mic.name] = mic
+                missing.discard(mic.name)
+        with _loopback_lock:
+            _loopback_mics.update(resolved)
+    return resolved
+
 class LoopbackCaptureSoundcard:
     """Soundcard-based loopback capture for system audio."""
     
@@ -329,7 +388,11 @@ class AudioTranscriptionBridge:
             try:
                 self.logger.info("Attempting soundcard loopback capture...")
                 mic, spk = resolve_loopback_mic()
-                preflight_loopback(mic)
+                try:
+                    preflight_loopback(mic)
+                except Exception:
+                    clear_loopback_cache()  # Don't keep handing out a mic that just failed
+                    raise
 
                 # Start loopback capture
                 self.loopback_capture = LoopbackCaptureSoundcard(mic, self._on_audio_data_received)
@@ -8,7 +8,6 @@ import sys
 import threading
 import atexit
 from contextlib import contextmanager
-from typing import Dict, Optional
 
 # Windows COM constants
 COINIT_APARTMENTTHREADED = 0x2
@@ -16,10 +15,8 @@ COINIT_MULTITHREADED = 0x0
 COINIT_DISABLE_OLE1DDE = 0x4
 COINIT_SPEED_OVER_MEMORY = 0x8
 
-# Thread-local COM state tracking
+# Thread-local COM state tracking (per thread object, so a recycled thread ident can't look initialized)
 _thread_local = threading.local()
-_global_com_state: Dict[int, bool] = {}
-_com_lock = threading.Lock()
 
 def _get_com_library():
     """Import COM library (Windows only)"""
@@ -34,34 +31,28 @@ def _get_com_library():
 
 def is_com_initialized() -> bool:
     """Check if COM is initialized in current thread"""
-    thread_id = threading.current_thread().ident
-    with _com_lock:
-        return _global_com_state.get(thread_id, False)
+    return getattr(_thread_local, 'initialized', False)
 
 def initialize_com_for_audio() -> bool:
     """Initialize COM for WASAPI audio access in current thread"""
     if sys.platform != "win32":
         return True  # Non-Windows systems don't need COM
 
+    # Already initialized for this thread: skip the CoInitializeEx round trip (it would return S_FALSE)
+    if getattr(_thread_local, 'initialized', False):
+        return True
+
     pythoncom = _get_com_library()
     if not pythoncom:
         return False
 
-    thread_id = threading.current_thread().ident
-
-    # Check if already initialized for this thread
-    if is_com_initialized():
-        return True
-
     try:
         # Initialize COM with apartment threading (required for WASAPI)
         # Use COINIT_APARTMENTTHREADED for compatibility with most audio APIs
         pythoncom.CoInitializeEx(COINIT_APARTMENTTHREADED | COINIT_DISABLE_OLE1DDE)
 
         # Mark as initialized for this thread
-        with _com_lock:
-            _global_com_state[thread_id] = True
-
+        _thread_local.initialized = True
         return True
 
     except Exception as e:
@@ -70,8 +61,7 @@ def initialize_com_for_audio() -> bool:
         try:
             # Try to use existing COM initialization
             pythoncom.CoInitialize()
-            with _com_lock:
-                _global_com_state[thread_id] = True
+            _thread_local.initialized = True
             return True
         except:
             # If both fail, COM initialization is problematic
@@ -86,16 +76,13 @@ def uninitialize_com() -> None:
     if not pythoncom:
         return
 
-    thread_id = threading.current_thread().ident
-
     if is_com_initialized():
         try:
             pythoncom.CoUninitialize()
         except:
             pass  # Ignore uninit errors
         finally:
-            with _com_lock:
-                _global_com_state.pop(thread_id, None)
+            _thread_local.initialized = False
 
 @contextmanager
 def com_context():
@@ -129,10 +116,8 @@ def com_audio_safe(func):
 # Cleanup COM on module exit
 @atexit.register
 def cleanup_com():
-    """Clean up COM state on exit"""
-    with _com_lock:
-        for thread_id in list(_global_com_state.keys()):
-            _global_com_state.pop(thread_id, None)
+    """Clean up COM state on exit (atexit runs on the main thread, so only its apartment is released)"""
+    uninitialize_com()
 
 if __name__ == "__main__":
     # Test COM initialization
@@ -5,6 +5,7 @@ Real faster-whisper integration with live audio streaming
 """
 
 import numpy as np
+import sys
 import threading
 import time
 import os
@@ -127,7 +128,10 @@ def reset_model_cache(model_size=None):
 
     return deleted
 
-@dataclass
+# One segment is created per streamed chunk; slots drop the per-instance __dict__ where supported
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class TranscriptionSegment:
     """Single transcription segment with speaker info"""
     start_time: float
@@ -260,18 +264,20 @@ class EnhancedWhisperManager:
         
         while self.transcriber_running:
             try:
-                # Get audio packet with timeout
-                pkt = audio_q.get(timeout=1.0)
+                # Get audio packet with timeout, plus anything that queued up behind it
+                pkts = [audio_q.get(timeout=1.0)]
+                pkts.extend(audio_q.drain_nowait())
                 
-                # Process the audio packet
-                audio = self.ensure_mono_and_resample(pkt["data"], pkt["sr"], target_sr=16000)
-                
-                # Add to sliding window
-                self.sliding_window.append({
-                    'audio': audio,
-                    'timestamp': pkt["t"],
-                    'duration': len(audio) / 16000.0
-                })
+                for pkt in pkts:
+                    # Process the audio packet
+                    audio = self.ensure_mono_and_resample(pkt["data"], pkt["sr"], target_sr=16000)
+                    
+                    # Add to sliding window
+                    self.sliding_window.append({
+                        'audio': audio,
+                        'timestamp': pkt["t"],
+                        'duration': len(audio) / 16000.0
+                    })
                 
                 # Maintain sliding window size
                 total_duration = sum(item['duration'] for item in self.sliding_window)
@@ -279,7 +285,7 @@ class EnhancedWhisperManager:
                     self.sliding_window.pop(0)
                     total_duration = sum(item['duration'] for item in self.sliding_window)
                 
-                # Run inference on rolling chunks
+                # Run inference on rolling chunks (once per drained batch, so a backlog is caught up in one pass)
                 if len(self.sliding_window) > 0:
                     self._process_sliding_window()
                     
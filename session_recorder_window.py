@@ -747,6 +747,7 @@ class SessionRecorderWindow:
                             }
                         }
                         session_id = self.storage_manager.start_session(session_metadata)
+                        self.audio_manager.add_audio_data_callback(self.storage_manager.append_audio)
                         self.logger.info(f"Started storage session: {session_id}")
                     except Exception as e:
                         self.logger.error(f"Failed to start storage session: {e}")
@@ -831,7 +832,8 @@ class SessionRecorderWindow:
             # Save session data
             if self.storage_manager:
                 try:
-                    # Save full session audio
+                    # Stop streaming audio and finalize the session audio file
+                    self.audio_manager.remove_audio_data_callback(self.storage_manager.append_audio)
                     self.storage_manager.save_full_session_audio(self.audio_manager)
                     
                     # End storage session
@@ -6,14 +6,19 @@ Handles durable file storage for recordings and transcripts with date-stamped or
 
 import os
 import json
+import math
 import time
-import uuid
+import queue
+import tempfile
+import threading
+import secrets
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Tuple, Any
 import logging
 import numpy as np
-import copy
 
 try:
     import soundfile as sf
@@ -22,6 +27,37 @@ except ImportError:
     SOUNDFILE_AVAILABLE = False
     import wave
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Write buffer for the append-only JSONL transcript stream
+JSONL_BUFFER_SIZE = 256 * 1024
+
+# Maximum threads used to read session metadata in list_sessions
+LIST_SESSIONS_WORKERS = 16
+
+# Requests handled by the background transcript writer
+IO_FLUSH = 'flush'
+IO_FLUSH_AND_STOP = 'flush_and_stop'
+
+# Bytes handed to the wave module per write in the fallback WAV path
+WAVE_WRITE_CHUNK = 1024 * 1024
+
+# Per-session files: key -> (base directory, filename)
+SESSION_FILE_LAYOUT = {
+    'audio_file': ('recording', 'audio.wav'),
+    'metadata_file': ('recording', 'metadata.json'),
+    'transcript_txt': ('transcript', 'transcript.txt'),
+    'transcript_jsonl': ('transcript', 'transcript.jsonl'),
+    'segments_json': ('transcript', 'segments.json'),
+}
+
+# Samples converted per block when turning float audio into 16-bit PCM
+PCM_CONVERT_BLOCK = 64 * 1024
+
 # Import project modules
 try:
     from enhanced_whisper_manager import TranscriptionSegment
@@ -44,6 +80,68 @@ except ImportError as e:
             self.confidence = confidence
             self.is_partial = is_partial
 
+def _dumps_json(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+_encode_json_str = json.encoder.encode_basestring_ascii
+
+def _encode_segment(segment: Dict[str, Any], start_key: str = 'start_time') -> bytes:
+    """
+    Serialize a segment dict with the fixed segment schema.
+    
+    Specialized stand-in for json.dumps when orjson is unavailable: fields are
+    formatted directly instead of going through the generic encoder. Values that
+    don't match the expected types fall back to _dumps_json.
+    
+    start_key names the start-time field in the output; transcript.jsonl has
+    always called it 'timestamp' while segments.json uses 'start_time'.
+    """
+    if start_key != 'start_time':
+        segment = {start_key if key == 'start_time' else key: value for key, value in segment.items()}
+    if ORJSON_AVAILABLE:
+        return _dumps_json(segment)
+    
+    start_time = segment[start_key]
+    end_time = segment['end_time']
+    confidence = segment['confidence']
+    speaker = segment['speaker']
+    text = segment['text']
+    is_partial = segment['is_partial']
+    
+    if (type(speaker) is not str or type(text) is not str or type(is_partial) is not bool
+            or not all(type(v) in (int, float) and math.isfinite(v) for v in (start_time, end_time, confidence))):
+        return _dumps_json(segment)
+    
+    return (
+        f'{{"{start_key}":{start_time!r},"end_time":{end_time!r},'
+        f'"speaker":{_encode_json_str(speaker)},"text":{_encode_json_str(text)},'
+        f'"confidence":{confidence!r},"is_partial":{"true" if is_partial else "false"}}}'
+    ).encode('ascii')
+
+@contextmanager
+def _atomic_write(path: Path):
+    """
+    Open a binary temp file next to path and atomically replace path with it on success.
+    
+    A crash mid-write leaves the previous file (or no file) rather than truncated JSON.
+    """
+    tmp = tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name + '.', suffix='.tmp', delete=False)
+    try:
+        with tmp:
+            yield tmp
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp.name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+
 class SessionStorageManager:
     """
     Manages durable file storage for recording sessions with the following structure:
@@ -75,18 +173,50 @@ class SessionStorageManager:
             self.recordings_dir = Path('./data/recordings')
             self.transcripts_dir = Path('./data/transcripts')
         
-        # Ensure base directories exist
-        self.recordings_dir.mkdir(parents=True, exist_ok=True)
-        self.transcripts_dir.mkdir(parents=True, exist_ok=True)
+        # Ensure base directories exist (paths already created this run are remembered)
+        self._ensured_dirs: set = set()
+        self._ensure_dir(self.recordings_dir)
+        self._ensure_dir(self.transcripts_dir)
+        
+        # list_sessions cache: date dir -> (mtime_ns, sessions)
+        self._list_cache: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+        
+        # get_session_files cache: (date, session_id) -> file paths
+        self._session_files_cache: Dict[Tuple[str, str], Dict[str, Path]] = {}
         
         # Current session state
         self.current_session: Optional[Dict[str, Any]] = None
         self.session_segments: List[TranscriptionSegment] = []
+        self._segment_dicts: List[Dict[str, Any]] = []
+        
+        # Append-only transcript streams for the active session
+        self._txt_fh = None
+        self._jsonl_fh = None
+        self._flushed_count = 0
+        self._last_flush = 0.0
+        self._midnight = 0  # Local midnight (epoch seconds) of the session date
+        
+        # Background transcript writer (one per active session)
+        self._io_q: Optional[queue.Queue] = None
+        self._io_thread: Optional[threading.Thread] = None
+        
+        # Streaming session audio writer (opened on the first appended chunk)
+        self._audio_writer = None
+        self._audio_frames = 0
+        self._audio_finalized = False  # Set once the session's audio.wav is closed; blocks lazy reopening
+        self._audio_lock = threading.Lock()
         
         self.logger.info(f"SessionStorageManager initialized")
         self.logger.info(f"  Recordings: {self.recordings_dir}")
         self.logger.info(f"  Transcripts: {self.transcripts_dir}")
 
+    def _ensure_dir(self, path: Path):
+        """Create a directory (and parents) unless it was already created this run"""
+        if path in self._ensured_dirs:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(path)
+
     def start_session(self, metadata: Optional[Dict[str, Any]] = None) -> str:
         """
         Start a new recording session with date-stamped storage.
@@ -102,15 +232,17 @@ class SessionStorageManager:
             self.end_session()
         
         # Generate session ID and date
-        session_id = f"session_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+        session_id = f"session_{int(time.time())}_{secrets.token_hex(4)}"
         date_str = datetime.now().strftime('%Y-%m-%d')
         
         # Create session directories
         session_recording_dir = self.recordings_dir / date_str / session_id
         session_transcript_dir = self.transcripts_dir / date_str / session_id
         
-        session_recording_dir.mkdir(parents=True, exist_ok=True)
-        session_transcript_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.recordings_dir / date_str)
+        self._ensure_dir(self.transcripts_dir / date_str)
+        self._ensure_dir(session_recording_dir)
+        self._ensure_dir(session_transcript_dir)
         
         # Initialize session state
         self.current_session = {
@@ -124,12 +256,19 @@ class SessionStorageManager:
             'stats': {
                 'total_segments': 0,
                 'total_duration': 0.0,
-                'speakers': set(),
+                'speakers': [],  # Distinct speakers in order of appearance
                 'start_timestamp': time.time()
             }
         }
         
         self.session_segments = []
+        self._segment_dicts = []
+        with self._audio_lock:
+            self._audio_finalized = False
+        self._midnight = int(time.mktime(time.strptime(date_str, '%Y-%m-%d')))
+        self._last_flush = time.time()
+        self._open_transcript_streams()
+        self._start_io_worker()
         
         self.logger.info(f"Started session: {session_id}")
         self.logger.info(f"  Recording dir: {session_recording_dir}")
@@ -148,39 +287,115 @@ class SessionStorageManager:
             self.logger.error("No active session to save segment to")
             return
         
-        # Add to session segments
+        # Add to session segments, building the serializable record once
         self.session_segments.append(segment)
+        self._segment_dicts.append({
+            'start_time': segment.start_time,
+            'end_time': segment.end_time,
+            'speaker': segment.speaker,
+            'text': segment.text,
+            'confidence': getattr(segment, 'confidence', 0.0),
+            'is_partial': getattr(segment, 'is_partial', False)
+        })
         
         # Update session stats
         self.current_session['stats']['total_segments'] += 1
-        self.current_session['stats']['speakers'].add(segment.speaker)
+        speakers = self.current_session['stats']['speakers']
+        if segment.speaker not in speakers:
+            speakers.append(segment.speaker)
         
         # Calculate duration
         if hasattr(segment, 'end_time') and hasattr(segment, 'start_time'):
             duration = segment.end_time - segment.start_time
             self.current_session['stats']['total_duration'] += max(0, duration)
         
-        # Save incrementally (every 10 segments or if it's been 30 seconds)
+        # Save incrementally (every 10 segments or if it's been 30 seconds since the last flush)
         should_save = (
             self.current_session['stats']['total_segments'] % 10 == 0 or
-            time.time() - self.current_session['stats']['start_timestamp'] > 30
+            time.time() - self._last_flush > 30
         )
         
         if should_save:
-            self._save_transcript_files()
+            self._io_q.put(IO_FLUSH)
+            self._last_flush = time.time()
             
         self.logger.debug(f"Saved segment: {segment.speaker}: {segment.text[:50]}...")
 
+    def append_audio(self, audio_data: np.ndarray, sample_rate: int, channels: int = 2):
+        """
+        Stream an audio chunk to the session's audio.wav as it is recorded.
+        
+        Signature matches AudioManager audio-data callbacks, which deliver
+        interleaved stereo float32 chunks.
+        
+        Args:
+            audio_data: Audio chunk (interleaved 1-D or frames x channels)
+            sample_rate: Sample rate of the chunk
+            channels: Channel count of interleaved 1-D chunks
+        """
+        if not self.current_session or not SOUNDFILE_AVAILABLE:
+            return
+        
+        if audio_data.ndim == 1 and channels > 1:
+            audio_data = audio_data.reshape(-1, channels)
+        
+        with self._audio_lock:
+            # A callback already in flight when the recording was finalized must not reopen
+            # (and truncate) audio.wav
+            if self._audio_finalized:
+                return
+            try:
+                if self._audio_writer is None:
+                    audio_file = self.current_session['recording_dir'] / 'audio.wav'
+                    self._audio_writer = sf.SoundFile(
+                        str(audio_file), 'w',
+                        samplerate=sample_rate,
+                        channels=1 if audio_data.ndim == 1 else audio_data.shape[1],
+                        subtype='PCM_16'
+                    )
+                    self._audio_frames = 0
+                
+                self._audio_writer.write(audio_data)
+                self._audio_frames += len(audio_data)
+                
+            except Exception as e:
+                self.logger.error(f"Error streaming session audio: {e}")
+
+    def _close_audio_writer(self) -> bool:
+        """Close the streaming audio writer. Returns True if one was open."""
+        with self._audio_lock:
+            self._audio_finalized = True
+            if self._audio_writer is None:
+                return False
+            
+            writer = self._audio_writer
+            self._audio_writer = None
+        
+        try:
+            writer.close()
+            file_size = os.path.getsize(writer.name) / (1024 * 1024)  # MB
+            duration = self._audio_frames / writer.samplerate
+            self.logger.info(f"Saved session audio: {file_size:.1f}MB, {duration:.1f}s")
+        except Exception as e:
+            self.logger.error(f"Error closing session audio: {e}")
+        
+        return True
+
     def save_full_session_audio(self, audio_manager):
         """
         Save the complete session audio from AudioManager.
         
+        If audio was streamed with append_audio, this just finalizes that file.
+        
         Args:
             audio_manager: AudioManager instance with recorded audio
         """
         if not self.current_session:
             self.logger.error("No active session to save audio to")
             return
+        
+        if self._close_audio_writer():
+            return
             
         try:
             # Get audio buffer from AudioManager
@@ -199,7 +414,7 @@ class SessionStorageManager:
             
             # Convert to numpy array if needed
             if isinstance(audio_data, list):
-                audio_data = np.concatenate(audio_data)
+                audio_data = self._concatenate_chunks(audio_data)
             
             # Save audio file
             audio_file = self.current_session['recording_dir'] / 'audio.wav'
@@ -221,83 +436,179 @@ class SessionStorageManager:
         except Exception as e:
             self.logger.error(f"Error saving session audio: {e}")
 
+    def _concatenate_chunks(self, chunks: List[np.ndarray]) -> np.ndarray:
+        """Copy audio chunks into a single preallocated array (avoids np.concatenate temporaries)"""
+        first = np.asarray(chunks[0])
+        total = sum(len(chunk) for chunk in chunks)
+        
+        out = np.empty((total,) + first.shape[1:], dtype=first.dtype)
+        offset = 0
+        for chunk in chunks:
+            n = len(chunk)
+            out[offset:offset + n] = chunk
+            offset += n
+        
+        return out
+
+    def _float_to_pcm16(self, audio_data: np.ndarray) -> np.ndarray:
+        """
+        Convert float audio in [-1, 1] to int16 PCM.
+        
+        Works block-by-block through a small float scratch buffer into a
+        preallocated int16 array, so no full-size float temporary is created
+        and the caller's array is left untouched.
+        """
+        pcm = np.empty(audio_data.shape, dtype=np.int16)
+        src = audio_data.reshape(-1)
+        dst = pcm.reshape(-1)
+        scratch = np.empty(min(PCM_CONVERT_BLOCK, src.size), dtype=np.float32)
+        
+        for start in range(0, src.size, PCM_CONVERT_BLOCK):
+            block = src[start:start + PCM_CONVERT_BLOCK]
+            buf = scratch[:len(block)]
+            np.clip(block, -1.0, 1.0, out=buf)
+            np.multiply(buf, 32767.0, out=buf)
+            np.rint(buf, out=buf)
+            dst[start:start + len(block)] = buf
+        
+        return pcm
+
     def _save_audio_with_wave(self, audio_data: np.ndarray, filepath: str, sample_rate: int):
         """Fallback method to save audio using wave module"""
-        # Ensure audio is in correct format
-        if audio_data.dtype == np.float32:
-            audio_data = (audio_data * 32767).astype(np.int16)
-        elif audio_data.dtype != np.int16:
+        # Ensure audio is 16-bit PCM; int16 input is used as-is (copied only if not contiguous)
+        if audio_data.dtype == np.int16:
+            audio_data = np.ascontiguousarray(audio_data)
+        elif np.issubdtype(audio_data.dtype, np.floating):
+            audio_data = self._float_to_pcm16(audio_data)
+        else:
             audio_data = audio_data.astype(np.int16)
         
+        # Zero-copy byte view of the PCM buffer, written in slices
+        pcm_bytes = memoryview(audio_data).cast('B')
+        
         with wave.open(filepath, 'wb') as wav_file:
             wav_file.setnchannels(1 if len(audio_data.shape) == 1 else audio_data.shape[1])
             wav_file.setsampwidth(2)  # 16-bit
             wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data.tobytes())
+            wav_file.setnframes(len(audio_data))  # Header is correct up front, no patch on close
+            for start in range(0, len(pcm_bytes), WAVE_WRITE_CHUNK):
+                wav_file.writeframesraw(pcm_bytes[start:start + WAVE_WRITE_CHUNK])
+
+    def _open_transcript_streams(self):
+        """Open the transcript txt/jsonl files in append mode for the current session"""
+        transcript_dir = self.current_session['transcript_dir']
+        
+        self._txt_fh = open(transcript_dir / 'transcript.txt', 'a', encoding='utf-8', buffering=1 << 16)
+        self._jsonl_fh = open(transcript_dir / 'transcript.jsonl', 'ab', buffering=JSONL_BUFFER_SIZE)
+        self._flushed_count = 0
+        
+        self._txt_fh.write(f"Session: {self.current_session['session_id']}\n")
+        self._txt_fh.write(f"Date: {self.current_session['date']}\n")
+        self._txt_fh.write(f"Started: {self.current_session['start_time']}\n")
+        self._txt_fh.write("-" * 50 + "\n\n")
+
+    def _close_transcript_streams(self):
+        """Close the transcript txt/jsonl files"""
+        for fh in (self._txt_fh, self._jsonl_fh):
+            if fh is not None:
+                try:
+                    fh.close()
+                except Exception as e:
+                    self.logger.error(f"Error closing transcript file: {e}")
+        
+        self._txt_fh = None
+        self._jsonl_fh = None
+
+    def _start_io_worker(self):
+        """Start the background thread that flushes transcript files off the caller's thread"""
+        self._io_q = queue.Queue()
+        self._io_thread = threading.Thread(target=self._io_loop, daemon=True, name="SessionStorageIO")
+        self._io_thread.start()
+
+    def _stop_io_worker(self):
+        """Flush pending transcript segments and wait for the background writer to exit"""
+        if self._io_thread is None:
+            return
+        
+        self._io_q.put(IO_FLUSH_AND_STOP)
+        self._io_thread.join()
+        self._io_thread = None
+        self._io_q = None
+
+    def _io_loop(self):
+        """Background writer loop: coalesce queued flush requests into single appends"""
+        while True:
+            request = self._io_q.get()
+            
+            # Any flushes queued while the previous write ran are covered by this one
+            while request != IO_FLUSH_AND_STOP:
+                try:
+                    request = self._io_q.get_nowait()
+                except queue.Empty:
+                    break
+            
+            self._save_transcript_files()
+            
+            if request == IO_FLUSH_AND_STOP:
+                return
+
+    def _format_clock(self, timestamp: float) -> str:
+        """Format an epoch timestamp as local HH:MM:SS using the cached session midnight"""
+        h, rem = divmod((int(timestamp) - self._midnight) % 86400, 3600)
+        m, sec = divmod(rem, 60)
+        return f"{h:02d}:{m:02d}:{sec:02d}"
 
     def _save_transcript_files(self):
-        """Save transcript files in multiple formats"""
-        if not self.current_session or not self.session_segments:
+        """Append segments added since the last flush to the transcript txt/jsonl files"""
+        if not self.current_session or self._txt_fh is None:
+            return
+        
+        new_segments = self._segment_dicts[self._flushed_count:]
+        if not new_segments:
             return
             
         try:
-            transcript_dir = self.current_session['transcript_dir']
-            
-            # Save as plain text
-            txt_file = transcript_dir / 'transcript.txt'
-            with open(txt_file, 'w', encoding='utf-8') as f:
-                f.write(f"Session: {self.current_session['session_id']}\n")
-                f.write(f"Date: {self.current_session['date']}\n")
-                f.write(f"Started: {self.current_session['start_time']}\n")
-                f.write("-" * 50 + "\n\n")
-                
-                for segment in self.session_segments:
-                    timestamp = time.strftime("%H:%M:%S", time.localtime(segment.start_time))
-                    f.write(f"[{timestamp}] {segment.speaker}: {segment.text}\n")
-            
-            # Save as JSONL (one JSON object per line)
-            jsonl_file = transcript_dir / 'transcript.jsonl'
-            with open(jsonl_file, 'w', encoding='utf-8') as f:
-                for segment in self.session_segments:
-                    segment_data = {
-                        'timestamp': segment.start_time,
-                        'end_time': segment.end_time,
-                        'speaker': segment.speaker,
-                        'text': segment.text,
-                        'confidence': getattr(segment, 'confidence', 0.0),
-                        'is_partial': getattr(segment, 'is_partial', False)
-                    }
-                    f.write(json.dumps(segment_data) + '\n')
-            
-            # Save complete segments as JSON
-            segments_file = transcript_dir / 'segments.json'
-            segments_data = []
-            for segment in self.session_segments:
-                segments_data.append({
-                    'start_time': segment.start_time,
-                    'end_time': segment.end_time,
-                    'speaker': segment.speaker,
-                    'text': segment.text,
-                    'confidence': getattr(segment, 'confidence', 0.0),
-                    'is_partial': getattr(segment, 'is_partial', False)
-                })
-            
-            with open(segments_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'session_id': self.current_session['session_id'],
-                    'segments': segments_data,
-                    'stats': {
-                        'total_segments': len(segments_data),
-                        'speakers': list(self.current_session['stats']['speakers']),
-                        'total_duration': self.current_session['stats']['total_duration']
-                    }
-                }, f, indent=2)
+            # Plain text
+            for segment in new_segments:
+                timestamp = self._format_clock(segment['start_time'])
+                self._txt_fh.write(f"[{timestamp}] {segment['speaker']}: {segment['text']}\n")
+            
+            # JSONL (one compact JSON object per line, written in a single batch)
+            self._jsonl_fh.writelines([_encode_segment(segment, 'timestamp') + b'\n' for segment in new_segments])
+            
+            self._txt_fh.flush()
+            self._jsonl_fh.flush()
+            self._flushed_count += len(new_segments)
                 
-            self.logger.debug(f"Saved transcript files: {len(self.session_segments)} segments")
+            self.logger.debug(f"Appended transcript files: {len(new_segments)} new segments "
+                              f"({self._flushed_count} total)")
             
         except Exception as e:
             self.logger.error(f"Error saving transcript files: {e}")
 
+    def _save_segments_json(self):
+        """Write the complete segments.json file (once, at session end)"""
+        try:
+            segments_file = self.current_session['transcript_dir'] / 'segments.json'
+            stats = {
+                'total_segments': len(self._segment_dicts),
+                'speakers': self.current_session['stats']['speakers'],
+                'total_duration': self.current_session['stats']['total_duration']
+            }
+            
+            # Stream one segment per line rather than serializing the whole document at once
+            with _atomic_write(segments_file) as f:
+                f.write(b'{"session_id":' + _dumps_json(self.current_session['session_id']) + b',"segments":[')
+                separator = b'\n'
+                for segment in self._segment_dicts:
+                    f.write(separator)
+                    f.write(_encode_segment(segment))
+                    separator = b',\n'
+                f.write(b'\n],"stats":' + _dumps_json(stats) + b'}\n')
+                
+        except Exception as e:
+            self.logger.error(f"Error saving segments file: {e}")
+
     def end_session(self) -> Optional[Dict[str, Any]]:
         """
         End the current session and save final files.
@@ -313,22 +624,29 @@ class SessionStorageManager:
             # Update end time
             self.current_session['end_time'] = datetime.now().isoformat()
             
-            # Save final transcript files
-            self._save_transcript_files()
+            # Finalize streamed audio if save_full_session_audio was not called
+            self._close_audio_writer()
+            
+            # Flush remaining transcript segments and write the full segments file
+            self._stop_io_worker()
+            self._close_transcript_streams()
+            self._save_segments_json()
             
             # Save session metadata
             metadata_file = self.current_session['recording_dir'] / 'metadata.json'
             
             # Prepare metadata for JSON serialization
-            metadata = copy.deepcopy(self.current_session)
-            metadata['stats']['speakers'] = list(metadata['stats']['speakers'])  # Convert set to list
+            metadata = self._session_snapshot()
             
             # Remove non-serializable fields
             metadata.pop('recording_dir', None)
             metadata.pop('transcript_dir', None)
             
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2)
+            with _atomic_write(metadata_file) as f:
+                f.write(json.dumps(metadata, indent=2).encode('utf-8'))
+            
+            # Writing metadata.json does not touch the date dir's mtime, so drop its cached listing
+            self._list_cache.pop(os.path.join(self.recordings_dir, self.current_session['date']), None)
             
             session_summary = {
                 'session_id': self.current_session['session_id'],
@@ -336,7 +654,7 @@ class SessionStorageManager:
                 'duration': time.time() - self.current_session['stats']['start_timestamp'],
                 'stats': {
                     'total_segments': len(self.session_segments),
-                    'speakers': list(self.current_session['stats']['speakers']),
+                    'speakers': self.current_session['stats']['speakers'],
                     'total_duration': self.current_session['stats']['total_duration']
                 }
             }
@@ -349,6 +667,7 @@ class SessionStorageManager:
             # Clear current session
             self.current_session = None
             self.session_segments = []
+            self._segment_dicts = []
             
             return session_summary
             
@@ -356,12 +675,18 @@ class SessionStorageManager:
             self.logger.error(f"Error ending session: {e}")
             return None
 
+    def _session_snapshot(self) -> Dict[str, Any]:
+        """Copy of the current session dict with its own stats and speakers list"""
+        stats = self.current_session['stats']
+        return {
+            **self.current_session,
+            'stats': {**stats, 'speakers': stats['speakers'].copy()}
+        }
+
     def get_session_info(self) -> Optional[Dict[str, Any]]:
         """Get current session information"""
         if self.current_session:
-            info = copy.deepcopy(self.current_session)
-            info['stats']['speakers'] = list(info['stats']['speakers'])
-            return info
+            return self._session_snapshot()
         return None
 
     def list_sessions(self, date: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -378,28 +703,45 @@ class SessionStorageManager:
         
         try:
             if date:
-                search_dirs = [self.recordings_dir / date]
+                date_dirs = [os.path.join(self.recordings_dir, date)]
             else:
-                search_dirs = [d for d in self.recordings_dir.iterdir() if d.is_dir()]
-            
-            for date_dir in search_dirs:
-                if not date_dir.is_dir():
-                    continue
-                    
-                for session_dir in date_dir.iterdir():
-                    if not session_dir.is_dir():
+                with os.scandir(self.recordings_dir) as entries:
+                    date_dirs = [entry.path for entry in entries if entry.is_dir()]
+            
+            # Reuse cached results for date directories whose mtime is unchanged
+            stale_dirs = {}
+            for date_dir in date_dirs:
+                try:
+                    mtime_ns = os.stat(date_dir).st_mtime_ns
+                    cached = self._list_cache.get(date_dir)
+                    if cached and cached[0] == mtime_ns:
+                        sessions.extend(cached[1])
                         continue
                     
-                    metadata_file = session_dir / 'metadata.json'
-                    if metadata_file.exists():
-                        try:
-                            with open(metadata_file, 'r', encoding='utf-8') as f:
-                                session_info = json.load(f)
-                                sessions.append(session_info)
-                        except Exception as e:
-                            self.logger.warning(f"Error reading session metadata {metadata_file}: {e}")
-            
-            # Sort by start time
+                    with os.scandir(date_dir) as entries:
+                        stale_dirs[date_dir] = (mtime_ns, [
+                            os.path.join(entry.path, 'metadata.json')
+                            for entry in entries if entry.is_dir()
+                        ])
+                except (FileNotFoundError, NotADirectoryError):
+                    self._list_cache.pop(date_dir, None)
+                    continue
+            
+            # Read metadata files concurrently; per-file latency dominates here
+            metadata_files = [f for _, files in stale_dirs.values() for f in files]
+            results = {}
+            if metadata_files:
+                workers = min(LIST_SESSIONS_WORKERS, len(metadata_files))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    results = dict(zip(metadata_files, pool.map(self._read_session_metadata, metadata_files)))
+            
+            for date_dir, (mtime_ns, files) in stale_dirs.items():
+                dir_sessions = [results[f] for f in files if results[f] is not None]
+                self._list_cache[date_dir] = (mtime_ns, dir_sessions)
+                sessions.extend(dir_sessions)
+            
+            # Sort by start time; callers get copies so mutating one can't corrupt the cache
+            sessions = [dict(session) for session in sessions]
             sessions.sort(key=lambda x: x.get('start_time', ''))
             
         except Exception as e:
@@ -407,6 +749,18 @@ class SessionStorageManager:
         
         return sessions
 
+    def _read_session_metadata(self, metadata_file: str) -> Optional[Dict[str, Any]]:
+        """Load one session's metadata.json, or None if it is missing or unreadable"""
+        try:
+            with open(metadata_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            # Session still active (metadata is written at end_session)
+            return None
+        except Exception as e:
+            self.logger.warning(f"Error reading session metadata {metadata_file}: {e}")
+            return None
+
     def get_session_files(self, session_id: str, date: Optional[str] = None) -> Optional[Dict[str, Path]]:
         """
         Get file paths for a specific session.
@@ -420,24 +774,28 @@ class SessionStorageManager:
         """
         try:
             if date:
-                search_dirs = [self.recordings_dir / date]
+                date_names = [date]
             else:
-                search_dirs = [d for d in self.recordings_dir.iterdir() if d.is_dir()]
+                with os.scandir(self.recordings_dir) as entries:
+                    date_names = [entry.name for entry in entries if entry.is_dir()]
             
-            for date_dir in search_dirs:
-                session_dir = date_dir / session_id
-                if session_dir.exists():
-                    transcript_dir = self.transcripts_dir / date_dir.name / session_id
-                    
-                    return {
-                        'recording_dir': session_dir,
-                        'transcript_dir': transcript_dir,
-                        'audio_file': session_dir / 'audio.wav',
-                        'metadata_file': session_dir / 'metadata.json',
-                        'transcript_txt': transcript_dir / 'transcript.txt',
-                        'transcript_jsonl': transcript_dir / 'transcript.jsonl',
-                        'segments_json': transcript_dir / 'segments.json'
+            for date_name in date_names:
+                session_dir = os.path.join(self.recordings_dir, date_name, session_id)
+                if not os.path.exists(session_dir):
+                    continue
+                
+                files = self._session_files_cache.get((date_name, session_id))
+                if files is None:
+                    bases = {
+                        'recording': session_dir,
+                        'transcript': os.path.join(self.transcripts_dir, date_name, session_id)
                     }
+                    files = {'recording_dir': Path(bases['recording']), 'transcript_dir': Path(bases['transcript'])}
+                    for key, (base, filename) in SESSION_FILE_LAYOUT.items():
+                        files[key] = Path(os.path.join(bases[base], filename))
+                    self._session_files_cache[(date_name, session_id)] = files
+                
+                return dict(files)
         except Exception as e:
             self.logger.error(f"Error getting session files for {session_id}: {e}")
         
@@ -10,11 +10,98 @@ from tkinter import messagebox, filedialog
 import threading
 import time
 import os
+import sys
+import json
+import functools
+import importlib
 import requests
-from typing import Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional, Callable, Mapping
 from logger_config import get_logger, log_function_call
 from theme_manager import get_theme_manager, apply_professional_styling
 
+# Available Whisper models with display details (model id, info), in display order
+_MODELS_INFO_PATH = Path(__file__).with_name('whisper_models.json')
+
+_MODELS_INFO = tuple(
+    (model_id, MappingProxyType(info))
+    for model_id, info in json.loads(_MODELS_INFO_PATH.read_bytes()).items()
+)
+
+# Executor.shutdown(cancel_futures=...) only exists on Python 3.9+; older versions just stop accepting work
+_SHUTDOWN_CANCEL = {'cancel_futures': True} if sys.version_info >= (3, 9) else {}
+
+# Toast background colors by notification kind
+_TOAST_COLORS = {
+    "info": "#2CC985",
+    "warning": "#F39C12",
+    "error": "#E74C3C",
+}
+
+# Loopback speaker names from the last enumeration; WASAPI enumeration is slow
+_SPEAKER_CACHE = {"ts": 0.0, "names": None}
+_SPEAKER_CACHE_TTL = 5.0
+
+
+def _cached_speaker_names() -> Optional[list]:
+    """Return cached speaker names, or None if the cache is empty or stale"""
+    if _SPEAKER_CACHE["names"] is None or time.monotonic() - _SPEAKER_CACHE["ts"] >= _SPEAKER_CACHE_TTL:
+        return None
+    return _SPEAKER_CACHE["names"]
+
+
+@functools.lru_cache(maxsize=4)
+def _abspath(path: str) -> str:
+    """Memoized os.path.abspath for the fixed default paths shown in the UI"""
+    return os.path.abspath(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _lazy_module(module_name: str):
+    """Import a heavy module on first use and hand back the same module object afterwards"""
+    return importlib.import_module(module_name)
+
+
+# Hugging Face hub cache, where faster-whisper stores models by default
+_HF_HUB_CACHE = Path(
+    os.environ.get('HF_HUB_CACHE')
+    or Path(os.environ.get('HF_HOME') or Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'huggingface') / 'hub'
+)
+
+# faster-whisper cache folders per model id ('large' resolves to v3, older releases to v2)
+_CACHED_MODEL_REPOS = {
+    'tiny': ('models--Systran--faster-whisper-tiny',),
+    'base': ('models--Systran--faster-whisper-base',),
+    'small': ('models--Systran--faster-whisper-small',),
+    'medium': ('models--Systran--faster-whisper-medium',),
+    'large': ('models--Systran--faster-whisper-large-v3', 'models--Systran--faster-whisper-large-v2'),
+}
+
+
+def _find_cached_whisper_models(extra_dirs=()) -> frozenset:
+    """Return ids of models with a downloaded snapshot in a known cache dir (no model load)"""
+    cache_dirs = [d for d in (*extra_dirs, _HF_HUB_CACHE) if d.is_dir()]
+    found = set()
+    for model_id, repos in _CACHED_MODEL_REPOS.items():
+        if any(
+            next((cache_dir / repo / 'snapshots').glob('*/model.bin'), None) is not None
+            for cache_dir in cache_dirs
+            for repo in repos
+        ):
+            found.add(model_id)
+    return frozenset(found)
+
+
+def _warmup_audio_modules():
+    """Import the loopback test's audio modules ahead of the first Test Device click"""
+    for module_name in ("com_initializer", "soundcard", "audio_transcription_bridge"):
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            pass  # Reported when the feature is actually used
+
 
 class SettingsWindow:
     """Main settings window with tabbed interface"""
@@ -32,6 +119,33 @@ class SettingsWindow:
         # Get theme manager for consistent styling
         self.theme_manager = get_theme_manager()
 
+        # Widgets restyled on theme change, as (widget, styling kind) pairs
+        self._styled_widgets = []
+
+        # Professional colors for the current theme, refreshed on theme change
+        self._theme_colors = self.theme_manager.get_theme_colors()
+
+        # Pending buffer label update while the slider is dragged
+        self._buffer_after_id = None
+
+        # Pending auto-hide of the toast notification
+        self._toast_after = None
+
+        # Resolved (loopback mic, speaker) pairs by device name for the device test
+        self._loopback_cache = {}
+
+        # Bounded pool for model downloads so repeated clicks queue instead of piling up threads
+        self._dl_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='whisper-dl')
+        # Model-list scans get their own worker so they never queue behind a running download
+        self._scan_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='model-scan')
+        # Bumped per model-list refresh so an older scan can't render over a newer one
+        self._model_list_gen = 0
+
+        # One long-lived WASAPI worker: COM is initialized once on it and device tests never overlap
+        self._audio_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='loopback-test')
+        # Import the audio modules on that worker now, ahead of the first Test Device click
+        self._audio_pool.submit(_warmup_audio_modules)
+
         # Register for theme changes
         self.theme_manager.register_theme_callback(self.on_theme_changed)
 
@@ -44,9 +158,21 @@ class SettingsWindow:
         self.window.geometry("700x600")
         self.window.resizable(True, True)
 
-        # Make window modal
+        # Shared fonts, created once per window instead of per widget
+        self._fonts = {
+            "h1": ctk.CTkFont(size=16, weight="bold"),
+            "h2": ctk.CTkFont(size=14, weight="bold"),
+            "body": ctk.CTkFont(size=12),
+            "small": ctk.CTkFont(size=11),
+            "tiny": ctk.CTkFont(size=10),
+        }
+
+        # Keep the window hidden while widgets are built so layout runs once
+        self.window.withdraw()
         self.window.transient(self.parent)
-        self.window.grab_set()
+
+        # Closing from the title bar must also unregister the theme callback
+        self.window.protocol("WM_DELETE_WINDOW", self.close_window)
 
         # Center the window
         self.window.update_idletasks()
@@ -55,22 +181,55 @@ class SettingsWindow:
         self.window.geometry(f"700x600+{x}+{y}")
 
         # Create tabbed interface
-        self.tabview = ctk.CTkTabview(self.window)
+        self.tabview = ctk.CTkTabview(self.window, command=self._on_tab_changed)
         self.tabview.pack(fill="both", expand=True, padx=20, pady=20)
 
-        # Create tabs
-        self.create_whisper_tab()
-        self.create_audio_tab()
-        self.create_preferences_tab()
+        # Add empty tabs; their contents are built on first activation
+        self._tab_builders = {
+            "Whisper Models": self.create_whisper_tab,
+            "Audio Devices": self.create_audio_tab,
+            "Preferences": self.create_preferences_tab,
+        }
+        self._tab_built = dict.fromkeys(self._tab_builders, False)
+        for tab_name in self._tab_builders:
+            self.tabview.add(tab_name)
+
+        # Whisper tab is shown first
+        self.tabview.set("Whisper Models")
+        self._on_tab_changed()
 
         # Bottom buttons
         self.create_bottom_buttons()
 
+        # Non-blocking notifications, shown over the bottom of the window
+        self._toast = ctk.CTkLabel(
+            self.window,
+            text="",
+            font=self._fonts["body"],
+            text_color="white",
+            corner_radius=6
+        )
+
+        # Show the finished window and make it modal (grab needs a viewable window)
+        self.window.update_idletasks()
+        self.window.deiconify()
+        self.window.grab_set()
+
         self.logger.debug("Settings window UI setup completed")
 
+    def _on_tab_changed(self):
+        """Build the selected tab's contents the first time it is shown"""
+        tab_name = self.tabview.get()
+        if self._tab_built.get(tab_name, True):
+            return
+
+        self._tab_built[tab_name] = True
+        self.logger.debug(f"Building settings tab: {tab_name}")
+        self._tab_builders[tab_name]()
+
     def create_whisper_tab(self):
         """Create Whisper models management tab"""
-        whisper_tab = self.tabview.add("Whisper Models")
+        whisper_tab = self.tabview.tab("Whisper Models")
 
         # Model status section
         status_frame = ctk.CTkFrame(whisper_tab)
@@ -79,15 +238,16 @@ class SettingsWindow:
         ctk.CTkLabel(
             status_frame,
             text="Whisper Model Status",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._fonts["h1"]
         ).pack(pady=(15, 10))
 
         self.whisper_status_label = ctk.CTkLabel(
             status_frame,
             text="Checking model status...",
-            font=ctk.CTkFont(size=12)
+            font=self._fonts["body"]
         )
         self.whisper_status_label.pack(pady=(0, 15))
+        self._styled_widgets.append((self.whisper_status_label, "label"))
 
         # Available models section
         models_frame = ctk.CTkFrame(whisper_tab)
@@ -96,12 +256,22 @@ class SettingsWindow:
         ctk.CTkLabel(
             models_frame,
             text="Available Models",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts["h2"]
         ).pack(pady=(15, 10))
 
         # Model list with scrollable frame
         self.model_scroll_frame = ctk.CTkScrollableFrame(models_frame)
         self.model_scroll_frame.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+        self._styled_widgets.append((self.model_scroll_frame, "frame"))
+
+        # Build model cards once; later refreshes only update their state
+        self._model_cards = {}
+        self.model_scroll_frame.pack_propagate(False)
+        try:
+            for model_id, info in _MODELS_INFO:
+                self._build_model_card(model_id, info)
+        finally:
+            self.model_scroll_frame.pack_propagate(True)
 
         # Populate model list
         self.update_model_list()
@@ -131,7 +301,7 @@ class SettingsWindow:
 
     def create_audio_tab(self):
         """Create audio devices configuration tab"""
-        audio_tab = self.tabview.add("Audio Devices")
+        audio_tab = self.tabview.tab("Audio Devices")
 
         # System Audio Device Picker section (NEW)
         system_audio_frame = ctk.CTkFrame(audio_tab)
@@ -140,7 +310,7 @@ class SettingsWindow:
         ctk.CTkLabel(
             system_audio_frame,
             text="System Audio Device (WASAPI Loopback)",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts["h2"]
         ).pack(pady=(15, 10))
 
         # Device selection frame
@@ -167,14 +337,24 @@ class SettingsWindow:
         )
         self.test_device_btn.pack(side="right")
 
+        # Rescan button bypasses the speaker cache
+        rescan_btn = ctk.CTkButton(
+            device_select_frame,
+            text="Rescan devices",
+            command=self.rescan_system_audio_devices,
+            width=110
+        )
+        rescan_btn.pack(side="right", padx=(0, 10))
+
         # Test status label
         self.test_status_label = ctk.CTkLabel(
             system_audio_frame,
             text="Select a device and click 'Test Device' to verify loopback functionality",
-            font=ctk.CTkFont(size=11),
+            font=self._fonts["small"],
             text_color="gray"
         )
         self.test_status_label.pack(pady=(5, 15))
+        self._styled_widgets.append((self.test_status_label, "label"))
 
         # Input devices section
         input_frame = ctk.CTkFrame(audio_tab)
@@ -183,7 +363,7 @@ class SettingsWindow:
         ctk.CTkLabel(
             input_frame,
             text="Input Devices (Microphones)",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts["h2"]
         ).pack(pady=(15, 10))
 
         self.input_devices_list = ctk.CTkTextbox(input_frame, height=100)
@@ -204,7 +384,7 @@ class SettingsWindow:
         ctk.CTkLabel(
             output_frame,
             text="System Audio Devices",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts["h2"]
         ).pack(pady=(15, 10))
 
         self.output_devices_list = ctk.CTkTextbox(output_frame, height=120)
@@ -233,7 +413,7 @@ class SettingsWindow:
 
     def create_preferences_tab(self):
         """Create application preferences tab"""
-        prefs_tab = self.tabview.add("Preferences")
+        prefs_tab = self.tabview.tab("Preferences")
 
         # Recording settings
         recording_frame = ctk.CTkFrame(prefs_tab)
@@ -242,7 +422,7 @@ class SettingsWindow:
         ctk.CTkLabel(
             recording_frame,
             text="Recording Settings",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts["h2"]
         ).pack(pady=(15, 10))
 
         # Buffer duration
@@ -262,7 +442,8 @@ class SettingsWindow:
 
         self.buffer_value_label = ctk.CTkLabel(buffer_frame, text="3 min")
         self.buffer_value_label.pack(side="left")
-        self.buffer_slider.configure(command=self.update_buffer_value)
+        self._styled_widgets.append((self.buffer_value_label, "label"))
+        self.buffer_slider.configure(command=self._on_buffer_change)
 
         # Sample rate
         sample_frame = ctk.CTkFrame(recording_frame, fg_color="transparent")
@@ -293,7 +474,7 @@ class SettingsWindow:
         ctk.CTkLabel(
             ui_frame,
             text="User Interface",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts["h2"]
         ).pack(pady=(15, 10))
 
         # Theme selection
@@ -335,7 +516,7 @@ class SettingsWindow:
         ctk.CTkLabel(
             storage_frame,
             text="Storage",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts["h2"]
         ).pack(pady=(15, 10))
 
         # Recording location
@@ -345,7 +526,8 @@ class SettingsWindow:
         ctk.CTkLabel(location_frame, text="Recording Location:").pack(anchor="w")
         self.location_entry = ctk.CTkEntry(location_frame, width=300)
         self.location_entry.pack(side="left", padx=(0, 5))
-        self.location_entry.insert(0, os.path.abspath("temp_recordings"))
+        self.location_entry.insert(0, _abspath("temp_recordings"))
+        self._styled_widgets.append((self.location_entry, "entry"))
 
         browse_btn = ctk.CTkButton(
             location_frame,
@@ -411,66 +593,55 @@ class SettingsWindow:
 
     @log_function_call('settings_window')
     def update_model_list(self):
-        """Update the list of available Whisper models"""
+        """Update the list of available Whisper models (installed state is queried off the UI thread)"""
         self.logger.debug("Updating Whisper model list")
-
-        # Clear existing widgets
-        for widget in self.model_scroll_frame.winfo_children():
-            widget.destroy()
-
-        # Define available models with details
-        models_info = {
-            'tiny': {
-                'name': 'Tiny (39 MB)',
-                'description': 'Fastest, least accurate. Good for testing.',
-                'size': '39 MB',
-                'speed': 'Very Fast',
-                'accuracy': 'Low'
-            },
-            'base': {
-                'name': 'Base (74 MB)',
-                'description': 'Balanced speed and accuracy.',
-                'size': '74 MB',
-                'speed': 'Fast',
-                'accuracy': 'Medium'
-            },
-            'small': {
-                'name': 'Small (244 MB)',
-                'description': 'Good balance for most users.',
-                'size': '244 MB',
-                'speed': 'Medium',
-                'accuracy': 'Good'
-            },
-            'medium': {
-                'name': 'Medium (769 MB)',
-                'description': 'Higher accuracy, slower processing.',
-                'size': '769 MB',
-                'speed': 'Slow',
-                'accuracy': 'High'
-            },
-            'large': {
-                'name': 'Large (1550 MB)',
-                'description': 'Best accuracy, slowest processing.',
-                'size': '1550 MB',
-                'speed': 'Very Slow',
-                'accuracy': 'Excellent'
-            }
-        }
-
-        # Get installed models
-        installed_models = []
+        self._model_list_gen += 1
+        try:
+            self._scan_pool.submit(self._fetch_installed_models, self._model_list_gen)
+        except RuntimeError as e:
+            self.logger.debug(f"Settings window closed before model list could be updated: {e}")
+
+    def _fetch_installed_models(self, generation: int):
+        """Pool worker: query installed models, then render the cards on the UI thread"""
+        # Models already sitting in a cache directory are installed without loading them
+        installed_models = _find_cached_whisper_models(self._model_cache_dirs())
         if self.model_manager:
             try:
-                installed_models = self.model_manager.get_installed_models()
-            except:
-                installed_models = []
+                installed_models |= {
+                    model_id for model_id, _ in _MODELS_INFO
+                    if model_id not in installed_models and self.model_manager.is_model_installed(model_id)
+                }
+            except Exception as e:
+                self.logger.warning(f"Failed to query installed models: {e}")
+
+        try:
+            self.window.after(0, lambda: self._render_model_list(installed_models, generation))
+        except Exception as e:
+            self.logger.debug(f"Settings window closed before model list could be updated: {e}")
+
+    def _model_cache_dirs(self) -> list:
+        """Model download directories configured for this app"""
+        dirs = []
+        models_dir = getattr(self.model_manager, 'models_dir', None)
+        if models_dir:
+            dirs.append(Path(models_dir))
+        try:
+            cache_dir = _lazy_module('transcription_config').MODEL_CACHE_DIR
+            dirs.append(Path(os.path.expandvars(cache_dir)))
+        except (ImportError, AttributeError):
+            pass
+        return dirs
+
+    def _render_model_list(self, installed_models: frozenset, generation: int):
+        """Update model cards in place (UI thread only); results from a superseded scan are ignored"""
+        if generation != self._model_list_gen or not self.window.winfo_exists():
+            return
 
-        # Create model cards
-        for model_id, info in models_info.items():
-            self.create_model_card(model_id, info, model_id in installed_models)
+        for model_id, _ in _MODELS_INFO:
+            self._refresh_model_card(model_id, model_id in installed_models)
 
-    def create_model_card(self, model_id: str, info: dict, is_installed: bool):
-        """Create a model card widget"""
+    def _build_model_card(self, model_id: str, info: Mapping[str, str]):
+        """Create a model card widget and register it in self._model_cards"""
         card_frame = ctk.CTkFrame(self.model_scroll_frame)
         card_frame.pack(fill="x", pady=5)
 
@@ -481,15 +652,14 @@ class SettingsWindow:
         model_name_label = ctk.CTkLabel(
             header_frame,
             text=info['name'],
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts["h2"]
         )
         model_name_label.pack(side="left")
 
         status_label = ctk.CTkLabel(
             header_frame,
-            text="Installed" if is_installed else "Not Installed",
-            text_color="#2CC985" if is_installed else "#E74C3C",
-            font=ctk.CTkFont(size=11)
+            text="",
+            font=self._fonts["small"]
         )
         status_label.pack(side="right")
 
@@ -497,7 +667,7 @@ class SettingsWindow:
         desc_label = ctk.CTkLabel(
             card_frame,
             text=info['description'],
-            font=ctk.CTkFont(size=11),
+            font=self._fonts["small"],
             text_color="gray"
         )
         desc_label.pack(anchor="w", padx=15)
@@ -511,48 +681,67 @@ class SettingsWindow:
         details_label = ctk.CTkLabel(
             details_frame,
             text=details_text,
-            font=ctk.CTkFont(size=10),
+            font=self._fonts["tiny"],
             text_color="gray"
         )
         details_label.pack(side="left")
 
-        # Action buttons
-        if is_installed:
-            # Load button
-            load_btn = ctk.CTkButton(
-                details_frame,
-                text="Load",
-                command=lambda m=model_id: self.load_model(m),
-                width=60,
-                height=25,
-                font=ctk.CTkFont(size=10),
-                fg_color=("#2CC985", "#2FA572")
-            )
-            load_btn.pack(side="right", padx=(5, 0))
+        # Action button (Download / Delete), configured by _refresh_model_card
+        action_btn = ctk.CTkButton(
+            details_frame,
+            text="",
+            height=25,
+            font=self._fonts["tiny"]
+        )
+        action_btn.pack(side="right")
 
-            # Delete button
-            delete_btn = ctk.CTkButton(
-                details_frame,
+        # Load button (only shown for installed models)
+        load_btn = ctk.CTkButton(
+            details_frame,
+            text="Load",
+            command=lambda m=model_id: self.load_model(m),
+            width=60,
+            height=25,
+            font=self._fonts["tiny"],
+            fg_color=("#2CC985", "#2FA572")
+        )
+
+        self._model_cards[model_id] = {
+            'status': status_label,
+            'action': action_btn,
+            'load': load_btn,
+            'installed': None
+        }
+
+    def _refresh_model_card(self, model_id: str, is_installed: bool):
+        """Update an existing model card for the model's installed state"""
+        card = self._model_cards[model_id]
+        if card['installed'] == is_installed:
+            return
+
+        card['status'].configure(
+            text="Installed" if is_installed else "Not Installed",
+            text_color="#2CC985" if is_installed else "#E74C3C"
+        )
+
+        if is_installed:
+            card['action'].configure(
                 text="Delete",
                 command=lambda m=model_id: self.delete_model(m),
                 width=60,
-                height=25,
-                font=ctk.CTkFont(size=10),
                 fg_color=("#E74C3C", "#C0392B")
             )
-            delete_btn.pack(side="right")
+            card['load'].pack(side="right", padx=(5, 0), before=card['action'])
         else:
-            # Download button
-            download_btn = ctk.CTkButton(
-                details_frame,
+            card['action'].configure(
                 text="Download",
                 command=lambda m=model_id: self.download_model(m),
                 width=80,
-                height=25,
-                font=ctk.CTkFont(size=10),
                 fg_color=("#3498DB", "#2E86AB")
             )
-            download_btn.pack(side="right")
+            card['load'].pack_forget()
+
+        card['installed'] = is_installed
 
     @log_function_call('settings_window')
     def download_model(self, model_id: str):
@@ -563,22 +752,28 @@ class SettingsWindow:
             # Update UI to show download in progress
             self.update_download_status(model_id, "downloading")
 
-            # Use the integrated download method in background thread
-            def download_worker():
-                try:
-                    success = self.model_manager.download_model(model_id)
-                    # Schedule UI update on main thread
-                    self.window.after(0, lambda: self.on_download_complete(model_id, success))
-                except Exception as e:
-                    self.logger.error(f"Download error for {model_id}: {e}")
-                    self.window.after(0, lambda: self.on_download_complete(model_id, False))
-
-            download_thread = threading.Thread(target=download_worker, daemon=True)
-            download_thread.start()
+            # Use the integrated download method on the download pool
+            future = self._dl_pool.submit(self.model_manager.download_model, model_id)
+            future.add_done_callback(lambda f: self._on_download_finished(model_id, f))
         else:
             # Fallback to download dialog
             DownloadDialog(self.window, model_id, self.on_download_complete)
 
+    def _on_download_finished(self, model_id: str, future):
+        """Pool callback: schedule on_download_complete on the main thread"""
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        if error is not None:
+            self.logger.error(f"Download error for {model_id}: {error}")
+        success = error is None and bool(future.result())
+
+        try:
+            self.window.after(0, lambda: self.on_download_complete(model_id, success))
+        except Exception as e:
+            self.logger.debug(f"Settings window closed before download of {model_id} finished: {e}")
+
     def update_download_status(self, model_id: str, status: str):
         """Update the download status for a specific model in the UI"""
         try:
@@ -597,25 +792,40 @@ class SettingsWindow:
         """Handle model download completion"""
         if success:
             self.logger.info(f"Model {model_id} downloaded successfully")
-            # Update status before showing dialog
+            # Update status before showing notification
             self.update_download_status(model_id, "completed")
-            messagebox.showinfo("Download Complete", f"Model '{model_id}' downloaded successfully!")
-            self.update_model_list()
+            self._toast_show(f"Model '{model_id}' downloaded successfully!")
             self.update_whisper_status()
         else:
             self.logger.error(f"Model {model_id} download failed")
-            messagebox.showerror("Download Failed", f"Failed to download model '{model_id}'")
+            self._toast_show(f"Failed to download model '{model_id}'", "error")
+
+    def _toast_show(self, message: str, kind: str = "info"):
+        """Show a short notification that hides itself after 3 seconds"""
+        color = _TOAST_COLORS.get(kind, _TOAST_COLORS["info"])
+        self._toast.configure(text=f"  {message}  ", fg_color=color)
+        self._toast.place(relx=0.5, rely=0.9, anchor="s")
+        self._toast.lift()
+
+        if self._toast_after is not None:
+            self.window.after_cancel(self._toast_after)
+        self._toast_after = self.window.after(3000, self._toast_hide)
+
+    def _toast_hide(self):
+        """Hide the toast notification"""
+        self._toast_after = None
+        self._toast.place_forget()
 
     def load_model(self, model_id: str):
         """Load a Whisper model"""
         self.logger.info(f"Loading Whisper model: {model_id}")
         try:
             # TODO: Implement model loading
-            messagebox.showinfo("Model Loaded", f"Model '{model_id}' loaded successfully!")
+            self._toast_show(f"Model '{model_id}' loaded successfully!")
             self.update_whisper_status()
         except Exception as e:
             self.logger.error(f"Failed to load model {model_id}: {e}")
-            messagebox.showerror("Load Failed", f"Failed to load model '{model_id}': {str(e)}")
+            self._toast_show(f"Failed to load model '{model_id}': {str(e)}", "error")
 
     def delete_model(self, model_id: str):
         """Delete a Whisper model"""
@@ -630,16 +840,16 @@ class SettingsWindow:
                 if self.model_manager:
                     success = self.model_manager.delete_model(model_id)
                     if success:
-                        messagebox.showinfo("Model Deleted", f"Model '{model_id}' deleted successfully!")
+                        self._toast_show(f"Model '{model_id}' deleted successfully!")
                         self.update_model_list()
                         self.update_whisper_status()
                     else:
-                        messagebox.showerror("Delete Failed", f"Failed to delete model '{model_id}'")
+                        self._toast_show(f"Failed to delete model '{model_id}'", "error")
                 else:
-                    messagebox.showerror("Error", "Model manager not available")
+                    self._toast_show("Model manager not available", "error")
             except Exception as e:
                 self.logger.error(f"Failed to delete model {model_id}: {e}")
-                messagebox.showerror("Delete Failed", f"Failed to delete model '{model_id}': {str(e)}")
+                self._toast_show(f"Failed to delete model '{model_id}': {str(e)}", "error")
 
     def refresh_whisper_models(self):
         """Refresh Whisper models list and status"""
@@ -667,44 +877,71 @@ class SettingsWindow:
             )
 
     def refresh_audio_devices(self):
-        """Refresh audio device lists"""
+        """Refresh audio device lists (devices are enumerated off the UI thread)"""
         self.logger.debug("Refreshing audio device lists")
+        threading.Thread(target=self._fetch_audio_devices, daemon=True).start()
 
+    def _fetch_audio_devices(self):
+        """Worker thread: enumerate audio devices, then render the lists on the UI thread"""
         try:
-            # Get input devices
+            # Initialize COM for WASAPI access in this thread
+            try:
+                from com_initializer import initialize_com_for_audio
+                initialize_com_for_audio()
+            except ImportError:
+                pass
+
             input_devices = self.audio_manager.get_input_devices()
-            input_text = "Input Devices (Microphones):\n" + "="*40 + "\n\n"
+            system_devices = self.audio_manager.get_system_audio_devices()
+        except Exception as e:
+            self.logger.error(f"Failed to refresh audio devices: {e}")
+            return
 
-            for i, device in enumerate(input_devices):
-                input_text += f"{i+1}. {device['name']}\n"
-                input_text += f"   Channels: {device['channels']}\n"
-                input_text += f"   Sample Rate: {int(device['sample_rate'])} Hz\n\n"
+        try:
+            self.window.after(0, lambda: self._render_audio_devices(input_devices, system_devices))
+        except Exception as e:
+            self.logger.debug(f"Settings window closed before device lists could be updated: {e}")
 
-            self.input_devices_list.configure(state="normal")
-            self.input_devices_list.delete("0.0", "end")
-            self.input_devices_list.insert("0.0", input_text)
-            self.input_devices_list.configure(state="disabled")
+    def _render_audio_devices(self, input_devices: list, system_devices: list):
+        """Fill the device list textboxes (UI thread only)"""
+        if not self.window.winfo_exists():
+            return
 
-            # Get system audio devices
-            system_devices = self.audio_manager.get_system_audio_devices()
-            output_text = "System Audio Devices:\n" + "="*40 + "\n\n"
+        try:
+            parts = ["Input Devices (Microphones):", "="*40, ""]
+            parts.extend(
+                f"{i+1}. {device['name']}\n"
+                f"   Channels: {device['channels']}\n"
+                f"   Sample Rate: {int(device['sample_rate'])} Hz\n"
+                for i, device in enumerate(input_devices)
+            )
+            input_text = "\n".join(parts)
+
+            self._set_textbox(self.input_devices_list, input_text)
 
+            parts = ["System Audio Devices:", "="*40, ""]
             for i, device in enumerate(system_devices):
-                output_text += f"{i+1}. {device['name']}\n"
-                output_text += f"   Type: {device['type']}\n"
+                lines = [f"{i+1}. {device['name']}", f"   Type: {device['type']}"]
                 if 'channels' in device:
-                    output_text += f"   Channels: {device['channels']}\n"
+                    lines.append(f"   Channels: {device['channels']}")
                 if 'sample_rate' in device:
-                    output_text += f"   Sample Rate: {int(device['sample_rate'])} Hz\n"
-                output_text += "\n"
+                    lines.append(f"   Sample Rate: {int(device['sample_rate'])} Hz")
+                lines.append("")
+                parts.append("\n".join(lines))
+            output_text = "\n".join(parts)
 
-            self.output_devices_list.configure(state="normal")
-            self.output_devices_list.delete("0.0", "end")
-            self.output_devices_list.insert("0.0", output_text)
-            self.output_devices_list.configure(state="disabled")
+            self._set_textbox(self.output_devices_list, output_text)
 
         except Exception as e:
-            self.logger.error(f"Failed to refresh audio devices: {e}")
+            self.logger.error(f"Failed to display audio devices: {e}")
+
+    @staticmethod
+    def _set_textbox(textbox, text: str):
+        """Replace the contents of a read-only textbox"""
+        textbox.configure(state="normal")
+        textbox.delete("0.0", "end")
+        textbox.insert("0.0", text)
+        textbox.configure(state="disabled")
 
     def test_input_device(self):
         """Test the selected input device"""
@@ -714,8 +951,15 @@ class SettingsWindow:
         """Test system audio recording"""
         messagebox.showinfo("Test Output", "System audio testing will be implemented soon.")
 
+    def _on_buffer_change(self, value):
+        """Coalesce slider drags into at most one label update per 50 ms"""
+        if self._buffer_after_id is not None:
+            self.window.after_cancel(self._buffer_after_id)
+        self._buffer_after_id = self.window.after(50, self.update_buffer_value, value)
+
     def update_buffer_value(self, value):
         """Update buffer duration display"""
+        self._buffer_after_id = None
         minutes = int(value)
         self.buffer_value_label.configure(text=f"{minutes} min")
 
@@ -739,12 +983,13 @@ class SettingsWindow:
             self.logger.info(f"Successfully changed theme to: {theme_name}")
         else:
             self.logger.error(f"Failed to change theme to: {theme_name}")
-            messagebox.showerror("Theme Error", f"Failed to apply {theme} theme")
+            self._toast_show(f"Failed to apply {theme} theme", "error")
 
     def on_theme_changed(self, theme_name: str, theme_config: dict):
         """Callback when theme changes - update UI styling"""
         try:
             self.logger.debug(f"Updating UI for theme change: {theme_name}")
+            self._theme_colors = theme_config.get("professional_colors") or {}
 
             # Apply professional styling to key elements
             if hasattr(self, 'window') and self.window.winfo_exists():
@@ -760,23 +1005,17 @@ class SettingsWindow:
     def apply_professional_styling(self):
         """Apply professional styling to settings window"""
         try:
-            colors = self.theme_manager.get_theme_colors()
+            colors = self._theme_colors
             if not colors:
                 return
 
-            # Apply professional styling to frames and labels if they exist
-            for attr_name in dir(self):
-                attr = getattr(self, attr_name)
-                if hasattr(attr, 'configure') and attr.winfo_exists():
-                    try:
-                        if 'frame' in attr_name.lower():
-                            apply_professional_styling(attr, "frame")
-                        elif 'label' in attr_name.lower():
-                            apply_professional_styling(attr, "label")
-                        elif 'entry' in attr_name.lower():
-                            apply_professional_styling(attr, "entry")
-                    except:
-                        pass  # Ignore styling errors
+            # Apply professional styling to registered frames, labels and entries
+            for widget, kind in self._styled_widgets:
+                try:
+                    if widget.winfo_exists():
+                        apply_professional_styling(widget, kind, colors)
+                except:
+                    pass  # Ignore styling errors
 
         except Exception as e:
             self.logger.debug(f"Professional styling update failed: {e}")
@@ -788,10 +1027,20 @@ class SettingsWindow:
             if hasattr(self, 'theme_manager'):
                 self.theme_manager.unregister_theme_callback(self.on_theme_changed)
 
-            if hasattr(self, 'window'):
-                self.window.destroy()
+            # Drop queued downloads; one already running finishes in the background
+            self._dl_pool.shutdown(wait=False, **_SHUTDOWN_CANCEL)
+            self._audio_pool.shutdown(wait=False, **_SHUTDOWN_CANCEL)
+            self._scan_pool.shutdown(wait=False, **_SHUTDOWN_CANCEL)
+
+            if self._toast_after is not None:
+                self.window.after_cancel(self._toast_after)
+                self._toast_after = None
         except Exception as e:
             self.logger.warning(f"Error closing settings window: {e}")
+        finally:
+            # Always close the window, even if part of the cleanup failed
+            if hasattr(self, 'window'):
+                self.window.destroy()
 
     def browse_recording_location(self):
         """Browse for recording location"""
@@ -809,46 +1058,87 @@ class SettingsWindow:
         self.logger.info("Applying settings")
 
         # TODO: Implement settings application
-        messagebox.showinfo("Settings Applied", "Settings have been applied successfully!")
+        self._toast_show("Settings have been applied successfully!")
 
     def ok(self):
         """Apply settings and close window"""
         self.apply_settings()
-        self.window.destroy()
+        self.close_window()
 
     def cancel(self):
         """Close window without applying settings"""
-        self.window.destroy()
+        self.close_window()
 
     def refresh_system_audio_devices(self):
-        """Refresh system audio devices for loopback capture"""
+        """Refresh system audio devices for loopback capture (enumerated off the UI thread)"""
         self.logger.debug("Refreshing system audio devices for loopback")
 
+        # Warm cache: no enumeration needed, so no worker thread either
+        device_names = _cached_speaker_names()
+        if device_names is not None:
+            self._apply_speaker_names(device_names)
+            return
+
+        self.system_audio_combo.configure(values=["Scanning..."])
+        self.system_audio_combo.set("Scanning...")
+        self._audio_pool.submit(self._fetch_system_audio_devices)
+
+    def rescan_system_audio_devices(self):
+        """Discard the cached speaker list and enumerate again"""
+        _SPEAKER_CACHE["ts"] = 0.0
+        self._loopback_cache.clear()
+        bridge = sys.modules.get('audio_transcription_bridge')
+        if bridge is not None:
+            bridge.clear_loopback_cache()
+        self.refresh_system_audio_devices()
+
+    def _fetch_system_audio_devices(self):
+        """Audio worker: enumerate speakers, then update the combo box on the UI thread"""
         try:
+            # Initialize COM for WASAPI access in this thread
+            try:
+                from com_initializer import initialize_com_for_audio
+                initialize_com_for_audio()
+            except ImportError:
+                pass
+
             # Try to import soundcard to get speaker devices
             try:
                 import soundcard as sc
                 speakers = sc.all_speakers()
-                device_names = [f"{speaker.name}" for speaker in speakers]
-
-                if not device_names:
-                    device_names = ["No audio devices found"]
-
-                self.system_audio_combo.configure(values=device_names)
-                if device_names and device_names[0] != "No audio devices found":
-                    self.system_audio_combo.set(device_names[0])  # Set to first device
-                else:
-                    self.system_audio_combo.set("No devices available")
+                device_names = [s.name for s in speakers]
+                _SPEAKER_CACHE.update(ts=time.monotonic(), names=device_names)
+                update = lambda: self._apply_speaker_names(device_names)
 
             except ImportError:
                 self.logger.warning("soundcard module not available for device enumeration")
-                self.system_audio_combo.configure(values=["soundcard module not installed"])
-                self.system_audio_combo.set("soundcard module not installed")
+                update = lambda: self._apply_system_device_list(
+                    ["soundcard module not installed"], "soundcard module not installed"
+                )
 
         except Exception as e:
             self.logger.error(f"Failed to refresh system audio devices: {e}")
-            self.system_audio_combo.configure(values=["Error loading devices"])
-            self.system_audio_combo.set("Error loading devices")
+            update = lambda: self._apply_system_device_list(["Error loading devices"], "Error loading devices")
+
+        try:
+            self.window.after(0, update)
+        except Exception as e:
+            self.logger.debug(f"Settings window closed before system devices could be updated: {e}")
+
+    def _apply_speaker_names(self, device_names: list):
+        """Show enumerated speakers, selecting the first one (UI thread only)"""
+        if device_names:
+            self._apply_system_device_list(device_names, device_names[0])
+        else:
+            self._apply_system_device_list(["No audio devices found"], "No devices available")
+
+    def _apply_system_device_list(self, device_names: list, current: str):
+        """Show the given choices in the combo box (UI thread only)"""
+        if not self.window.winfo_exists():
+            return
+
+        self.system_audio_combo.configure(values=device_names)
+        self.system_audio_combo.set(current)
 
     def on_system_device_selected(self, device_name: str):
         """Handle system audio device selection"""
@@ -856,8 +1146,7 @@ class SettingsWindow:
 
         # Update configuration (save selected device)
         try:
-            from transcription_config import get_transcription_config
-            config = get_transcription_config()
+            config = _lazy_module('transcription_config').get_transcription_config()
             config._config['loopback_device_name'] = device_name if device_name != "Default" else None
 
             self.test_status_label.configure(
@@ -871,7 +1160,7 @@ class SettingsWindow:
         """Test the selected loopback device"""
         selected_device = self.system_audio_combo.get()
 
-        if selected_device in ["No devices available", "Error loading devices", "soundcard module not installed"]:
+        if selected_device in ["Scanning...", "No devices available", "Error loading devices", "soundcard module not installed"]:
             self.test_status_label.configure(
                 text="Cannot test: No valid device selected",
                 text_color="#E74C3C"
@@ -882,45 +1171,51 @@ class SettingsWindow:
         self.test_status_label.configure(text="Testing device...", text_color="#F39C12")
         self.test_device_btn.configure(state="disabled")
 
-        def test_worker():
-            """Test loopback device in background thread"""
+        # Run the test on the audio worker thread
+        self._audio_pool.submit(self._run_loopback_test, selected_device)
+
+    def _run_loopback_test(self, selected_device: str):
+        """Test loopback device on the audio worker thread"""
+        try:
+            # Initialize COM for WASAPI access in this thread (no-op after the first test)
             try:
-                # Initialize COM for WASAPI access in this thread
-                try:
-                    from com_initializer import initialize_com_for_audio
-                    if not initialize_com_for_audio():
-                        raise RuntimeError("Failed to initialize COM for WASAPI audio access")
-                except ImportError:
-                    # COM initializer not available (non-Windows systems)
-                    pass
+                from com_initializer import initialize_com_for_audio
+                if not initialize_com_for_audio():
+                    raise RuntimeError("Failed to initialize COM for WASAPI audio access")
+            except ImportError:
+                # COM initializer not available (non-Windows systems)
+                pass
 
-                from audio_transcription_bridge import resolve_loopback_mic, preflight_loopback
+            from audio_transcription_bridge import resolve_loopback_mic, preflight_loopback, clear_loopback_cache
 
-                # Temporarily set the device name
-                device_name = selected_device if selected_device != "Default" else None
+            device_name = selected_device if selected_device != "Default" else None
 
-                # Test the device
-                mic, spk = resolve_loopback_mic() if device_name is None else resolve_loopback_mic()
+            # Test the selected device; repeated tests reuse the resolved pair
+            if device_name not in self._loopback_cache:
+                self._loopback_cache[device_name] = resolve_loopback_mic(device_name)
+            mic, spk = self._loopback_cache[device_name]
+            try:
                 preflight_loopback(mic)
+            except Exception:
+                # Device may have changed; resolve it again on the next test
+                self._loopback_cache.pop(device_name, None)
+                clear_loopback_cache()
+                raise
 
-                # Success
-                self.window.after(0, lambda: self.test_device_success(selected_device))
+            # Success
+            self.window.after(0, lambda: self.test_device_success(selected_device))
 
-            except Exception as e:
-                error_msg = str(e)
-                # Provide more helpful error messages for common COM issues
-                if "0x800401f0" in error_msg:
-                    error_msg = "COM initialization failed - try running as administrator"
-                elif "0x80070005" in error_msg:
-                    error_msg = "Audio device access denied - check device permissions"
-                elif "device not found" in error_msg.lower():
-                    error_msg = "Audio device not found or not accessible"
-
-                self.window.after(0, lambda: self.test_device_failed(selected_device, error_msg))
+        except Exception as e:
+            error_msg = str(e)
+            # Provide more helpful error messages for common COM issues
+            if "0x800401f0" in error_msg:
+                error_msg = "COM initialization failed - try running as administrator"
+            elif "0x80070005" in error_msg:
+                error_msg = "Audio device access denied - check device permissions"
+            elif "device not found" in error_msg.lower():
+                error_msg = "Audio device not found or not accessible"
 
-        # Start test in background thread
-        test_thread = threading.Thread(target=test_worker, daemon=True)
-        test_thread.start()
+            self.window.after(0, lambda: self.test_device_failed(selected_device, error_msg))
 
     def test_device_success(self, device_name: str):
         """Handle successful device test"""
@@ -951,29 +1246,18 @@ class SettingsWindow:
         if result:
             self.logger.info("Resetting Whisper model cache")
             try:
-                from enhanced_whisper_manager import reset_model_cache
-
-                success = reset_model_cache()  # Reset cache for current model
+                success = _lazy_module('enhanced_whisper_manager').reset_model_cache()  # Reset cache for current model
 
                 if success:
-                    messagebox.showinfo(
-                        "Cache Reset",
-                        "Model cache has been reset successfully.\nModels will be re-downloaded on next use."
-                    )
+                    self._toast_show("Model cache reset - models will be re-downloaded on next use")
                     self.update_model_list()
                     self.update_whisper_status()
                 else:
-                    messagebox.showwarning(
-                        "Cache Reset",
-                        "No cache found to reset, or reset failed.\nCheck logs for details."
-                    )
+                    self._toast_show("No cache found to reset, or reset failed - check logs", "warning")
 
             except Exception as e:
                 self.logger.error(f"Failed to reset model cache: {e}")
-                messagebox.showerror(
-                    "Cache Reset Failed",
-                    f"Failed to reset model cache:\n{str(e)}"
-                )
+                self._toast_show(f"Failed to reset model cache: {str(e)}", "error")
 
 
 class DownloadDialog:
@@ -983,7 +1267,10 @@ class DownloadDialog:
         self.parent = parent
         self.model_id = model_id
         self.on_complete = on_complete
-        self.download_cancelled = False
+        self._cancel_event = threading.Event()
+        # At most one progress redraw queued on the Tk loop at a time
+        self._progress_pending = False
+        self._latest_progress = 0.0
 
         self.logger = get_logger('model_download')
         self.setup_ui()
@@ -1054,16 +1341,16 @@ class DownloadDialog:
             # Simulate download process (replace with actual download logic)
             total_steps = 100
             for i in range(total_steps):
-                if self.download_cancelled:
+                # Simulate download time; wakes immediately on cancel
+                if self._cancel_event.wait(0.05):
                     self.logger.info("Download cancelled by user")
                     return
 
-                # Simulate download progress
-                time.sleep(0.05)  # Simulate download time
-                progress = (i + 1) / total_steps
-
-                # Update UI on main thread
-                self.window.after(0, lambda p=progress: self.update_progress(p))
+                # Update UI on main thread, coalescing updates posted before the next idle cycle
+                self._latest_progress = (i + 1) / total_steps
+                if not self._progress_pending:
+                    self._progress_pending = True
+                    self.window.after_idle(self._flush_progress)
 
             # Download completed
             self.window.after(0, self.download_complete)
@@ -1072,6 +1359,11 @@ class DownloadDialog:
             self.logger.error(f"Download failed: {e}")
             self.window.after(0, lambda: self.download_failed(str(e)))
 
+    def _flush_progress(self):
+        """Draw the most recent progress value (UI thread only)"""
+        self._progress_pending = False
+        self.update_progress(self._latest_progress)
+
     def update_progress(self, progress: float):
         """Update progress bar and status"""
         self.progress_bar.set(progress)
@@ -1092,7 +1384,7 @@ class DownloadDialog:
 
     def cancel_download(self):
         """Cancel the download"""
-        self.download_cancelled = True
+        self._cancel_event.set()
         self.window.destroy()
         self.on_complete(self.model_id, False)
 
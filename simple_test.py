@@ -3,68 +3,55 @@
 Simple test of Amanuensis components
 """
 
+import subprocess
 import sys
-import traceback
+from concurrent.futures import ThreadPoolExecutor
 
-def main():
-    """Test basic functionality"""
-    print("Testing Amanuensis components...")
+# Each check runs in its own interpreter so COM state and open audio devices can't leak between them
+CHECKS = [
+    ("CustomTkinter", "import customtkinter"),
+    ("ConfigManager", "from config_manager import SecureConfigManager; SecureConfigManager()"),
+    ("AudioManager", "from audio_manager import AudioManager; AudioManager()"),
+    ("SpeakerManager", "from speaker_manager import SpeakerManager; SpeakerManager()"),
+    ("APIManager", "from config_manager import SecureConfigManager; from api_manager import APIManager; "
+                   "APIManager(SecureConfigManager())"),
+    ("AmanuensisApp", "from amanuensis_ctk import AmanuensisApp; AmanuensisApp()"),
+]
 
-    # Test CustomTkinter
-    try:
-        import customtkinter as ctk
-        print("CustomTkinter: OK")
-    except Exception as e:
-        print(f"CustomTkinter: ERROR - {e}")
-        return False
+CHECK_TIMEOUT = 30
 
-    # Test config manager
-    try:
-        from config_manager import SecureConfigManager
-        config = SecureConfigManager()
-        print("ConfigManager: OK")
-    except Exception as e:
-        print(f"ConfigManager: ERROR - {e}")
-        return False
 
-    # Test audio manager
+def _run_check(check):
+    """Run one component check in a fresh interpreter, returning (name, ok, error output)"""
+    name, code = check
     try:
-        from audio_manager import AudioManager
-        audio = AudioManager()
-        print("AudioManager: OK")
-    except Exception as e:
-        print(f"AudioManager: ERROR - {e}")
-        return False
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=CHECK_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        return name, False, f"timed out after {CHECK_TIMEOUT}s"
+    return name, result.returncode == 0, result.stderr.strip()
 
-    # Test speaker manager
-    try:
-        from speaker_manager import SpeakerManager
-        speaker = SpeakerManager()
-        print("SpeakerManager: OK")
-    except Exception as e:
-        print(f"SpeakerManager: ERROR - {e}")
-        return False
 
-    # Test API manager
-    try:
-        from api_manager import APIManager
-        api = APIManager(config)
-        print("APIManager: OK")
-    except Exception as e:
-        print(f"APIManager: ERROR - {e}")
-        return False
+def main():
+    """Test basic functionality"""
+    print("Testing Amanuensis components...")
 
-    # Test main app
-    try:
-        from amanuensis_ctk import AmanuensisApp
-        app = AmanuensisApp()
-        print("AmanuensisApp: OK")
+    with ThreadPoolExecutor(max_workers=len(CHECKS)) as ex:
+        results = list(ex.map(_run_check, CHECKS))
+
+    success = True
+    for name, ok, error in results:
+        if ok:
+            print(f"{name}: OK")
+        else:
+            last_line = error.splitlines()[-1] if error else "unknown error"
+            print(f"{name}: ERROR - {last_line}")
+            if error:
+                print(error)
+            success = False
+
+    if success:
         print("All components loaded successfully!")
-        return True
-    except Exception as e:
-        print(f"AmanuensisApp: ERROR - {e}")
-        traceback.print_exc()
-        return False
+    return success
 
 if __name__ == "__main__":
     success = main()
@@ -72,4 +59,4 @@ if __name__ == "__main__":
         print("\nTest PASSED - App should run correctly")
     else:
         print("\nTest FAILED - Check errors above")
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(0 if success else 1)
@@ -1,179 +1,239 @@
 import sqlite3
 import json
+import re
 import time
+import queue
+import threading
+from concurrent.futures import Future
 from typing import Dict, List, Optional
+from logger_config import get_logger
+
+# Transcript rows are written in batches by a background writer
+TRANSCRIPT_BATCH_SIZE = 32
+TRANSCRIPT_FLUSH_INTERVAL = 0.25  # seconds
+
+# Therapeutic language patterns that mark system-audio speech as the therapist's
+THERAPEUTIC_PHRASES = (
+    "how does that make you feel",
+    "let's explore that",
+    "what comes up for you",
+    "can you tell me more",
+    "i'm hearing",
+    "it sounds like"
+)
+_THERAPY_RE = re.compile("|".join(map(re.escape, THERAPEUTIC_PHRASES)), re.IGNORECASE)
+
+# Statements run per segment or per session, defined once
+_SQL_INSERT_TRANSCRIPT = '''
+    INSERT INTO transcripts
+    (session_id, timestamp, speaker_name, speaker_role, text, confidence)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_SESSION_SPEAKER = '''
+    INSERT INTO session_speakers (session_id, speaker_name, speaker_role, audio_channel)
+    VALUES (?, ?, ?, ?)
+'''
+
+_SQL_SELECT_TRANSCRIPT = '''
+    SELECT id, timestamp, speaker_name, speaker_role, text, confidence
+    FROM transcripts
+    WHERE session_id = ?
+    ORDER BY timestamp ASC
+'''
+
+_SQL_FORMAT_TRANSCRIPT = '''
+    SELECT '[' || speaker_name || ']: ' || text
+    FROM transcripts
+    WHERE session_id = ? AND (? IS NULL OR timestamp >= ?)
+    ORDER BY timestamp ASC
+'''
+
+_SQL_SESSION_SUMMARY = '''
+    SELECT s.session_date, s.client_count, s.session_type, s.duration_minutes, s.status,
+           t.speaker_name, COUNT(t.id), SUM(LENGTH(t.text))
+    FROM sessions s
+    LEFT JOIN transcripts t ON t.session_id = s.id
+    WHERE s.id = ?
+    GROUP BY t.speaker_name
+'''
+
+# Writer queue control markers
+_FLUSH = object()
+_STOP = object()
 
 class SpeakerManager:
     def __init__(self, db_file="session_data.db"):
         self.db_file = db_file
+
+        # One connection for the manager's lifetime, shared across threads under a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-8000")
+        self._conn.execute("PRAGMA cache_spill=OFF")
+
         self.init_database()
         self.current_session_speakers = {}
+        self._role_by_speaker: Dict[str, str] = {}  # speaker name -> role for the current session
         self.speaker_profiles = {}
 
+        self.logger = get_logger('speaker_manager')
+
+        # Write-behind queue for transcript rows; SQLite assigns the ids when the writer inserts them
+        self._write_q = queue.Queue()
+        self._writer_state_lock = threading.Lock()
+        self._writer_closed = False
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="SpeakerManagerWriter", daemon=True
+        )
+        self._writer_thread.start()
+
     def init_database(self):
         """Initialize the database with required tables"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-
-        # Speaker profiles table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS speaker_profiles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE NOT NULL,
-                voice_characteristics TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        # Sessions table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS sessions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                client_count INTEGER NOT NULL,
-                session_type TEXT DEFAULT 'individual',
-                notes TEXT,
-                duration_minutes REAL,
-                status TEXT DEFAULT 'active'
-            )
-        ''')
-
-        # Session speakers table (many-to-many relationship)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS session_speakers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id INTEGER,
-                speaker_name TEXT NOT NULL,
-                speaker_role TEXT NOT NULL,
-                audio_channel INTEGER,
-                FOREIGN KEY (session_id) REFERENCES sessions (id)
-            )
-        ''')
-
-        # Transcripts table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS transcripts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id INTEGER,
-                timestamp REAL NOT NULL,
-                speaker_name TEXT NOT NULL,
-                speaker_role TEXT NOT NULL,
-                text TEXT NOT NULL,
-                confidence REAL DEFAULT 0.0,
-                FOREIGN KEY (session_id) REFERENCES sessions (id)
-            )
-        ''')
-
-        conn.commit()
-        conn.close()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+
+            # Speaker profiles table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS speaker_profiles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT UNIQUE NOT NULL,
+                    voice_characteristics TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            # Sessions table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS sessions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    session_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    client_count INTEGER NOT NULL,
+                    session_type TEXT DEFAULT 'individual',
+                    notes TEXT,
+                    duration_minutes REAL,
+                    status TEXT DEFAULT 'active'
+                )
+            ''')
+
+            # Session speakers table (many-to-many relationship)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS session_speakers (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    session_id INTEGER,
+                    speaker_name TEXT NOT NULL,
+                    speaker_role TEXT NOT NULL,
+                    audio_channel INTEGER,
+                    FOREIGN KEY (session_id) REFERENCES sessions (id)
+                )
+            ''')
+
+            # Transcripts table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS transcripts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    session_id INTEGER,
+                    timestamp REAL NOT NULL,
+                    speaker_name TEXT NOT NULL,
+                    speaker_role TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    confidence REAL DEFAULT 0.0,
+                    FOREIGN KEY (session_id) REFERENCES sessions (id)
+                )
+            ''')
+
+            # Indexes for per-session lookups and recent-session listing
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_transcripts_session_ts
+                ON transcripts (session_id, timestamp)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_session_speakers_session
+                ON session_speakers (session_id)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_sessions_date
+                ON sessions (session_date DESC)
+            ''')
 
     def create_session(self, client_count: int, session_type: str = "individual") -> int:
         """Create a new therapy session"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
 
-        cursor.execute('''
-            INSERT INTO sessions (client_count, session_type, status)
-            VALUES (?, ?, 'active')
-        ''', (client_count, session_type))
+            cursor.execute('''
+                INSERT INTO sessions (client_count, session_type, status)
+                VALUES (?, ?, 'active')
+            ''', (client_count, session_type))
 
-        session_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+            session_id = cursor.lastrowid
 
         self.current_session_id = session_id
         self.current_session_speakers = {}
+        self._role_by_speaker = {}
 
         return session_id
 
     def setup_session_speakers(self, session_id: int, client_count: int, speaker_names: List[str] = None):
         """Setup speakers for the current session"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-
-        # Always add therapist
-        cursor.execute('''
-            INSERT INTO session_speakers (session_id, speaker_name, speaker_role, audio_channel)
-            VALUES (?, 'THERAPIST', 'therapist', 0)
-        ''', (session_id,))
-
-        self.current_session_speakers['THERAPIST'] = {
-            'role': 'therapist',
-            'channel': 0,
-            'name': 'THERAPIST'
-        }
-
-        # Add clients
+        # Always add therapist, then clients (given names or default naming)
         if speaker_names and len(speaker_names) >= client_count:
-            for i, name in enumerate(speaker_names[:client_count]):
-                cursor.execute('''
-                    INSERT INTO session_speakers (session_id, speaker_name, speaker_role, audio_channel)
-                    VALUES (?, ?, 'client', 1)
-                ''', (session_id, name))
-
-                self.current_session_speakers[name] = {
-                    'role': 'client',
-                    'channel': 1,
-                    'name': name
-                }
+            client_names = speaker_names[:client_count]
         else:
-            # Default client naming
-            for i in range(client_count):
-                client_name = f"CLIENT_{i+1}" if client_count > 1 else "CLIENT"
-                cursor.execute('''
-                    INSERT INTO session_speakers (session_id, speaker_name, speaker_role, audio_channel)
-                    VALUES (?, ?, 'client', 1)
-                ''', (session_id, client_name))
-
-                self.current_session_speakers[client_name] = {
-                    'role': 'client',
-                    'channel': 1,
-                    'name': client_name
-                }
+            client_names = [f"CLIENT_{i+1}" if client_count > 1 else "CLIENT" for i in range(client_count)]
+
+        speakers = [('THERAPIST', 'therapist', 0)] + [(name, 'client', 1) for name in client_names]
 
-        conn.commit()
-        conn.close()
+        with self._lock, self._conn:
+            self._conn.executemany(_SQL_INSERT_SESSION_SPEAKER, [(session_id, name, role, channel) for name, role, channel in speakers])
+
+        for name, role, channel in speakers:
+            self.current_session_speakers[name] = {
+                'role': role,
+                'channel': channel,
+                'name': name
+            }
+            self._role_by_speaker[name] = role
 
     def add_speaker_profile(self, name: str, characteristics: Dict = None):
         """Add or update a speaker profile"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
 
-        characteristics_json = json.dumps(characteristics) if characteristics else None
+            characteristics_json = json.dumps(characteristics) if characteristics else None
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO speaker_profiles
-            (name, voice_characteristics, last_used)
-            VALUES (?, ?, CURRENT_TIMESTAMP)
-        ''', (name, characteristics_json))
-
-        conn.commit()
-        conn.close()
+            cursor.execute('''
+                INSERT OR REPLACE INTO speaker_profiles
+                (name, voice_characteristics, last_used)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+            ''', (name, characteristics_json))
 
         self.speaker_profiles[name] = characteristics or {}
 
     def get_speaker_profiles(self) -> Dict:
         """Get all stored speaker profiles"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT name, voice_characteristics, last_used
-            FROM speaker_profiles
-            ORDER BY last_used DESC
-        ''')
-
-        profiles = {}
-        for row in cursor.fetchall():
-            name, characteristics_json, last_used = row
-            characteristics = json.loads(characteristics_json) if characteristics_json else {}
-            profiles[name] = {
-                'characteristics': characteristics,
-                'last_used': last_used
-            }
+        with self._lock:
+            cursor = self._conn.cursor()
+
+            cursor.execute('''
+                SELECT name, voice_characteristics, last_used
+                FROM speaker_profiles
+                ORDER BY last_used DESC
+            ''')
+
+            profiles = {}
+            for row in cursor.fetchall():
+                name, characteristics_json, last_used = row
+                characteristics = json.loads(characteristics_json) if characteristics_json else {}
+                profiles[name] = {
+                    'characteristics': characteristics,
+                    'last_used': last_used
+                }
 
-        conn.close()
         return profiles
 
     def identify_speaker_from_transcript(self, text: str, audio_channel: int) -> str:
@@ -188,192 +248,219 @@ class SpeakerManager:
 
         # Channel 1 = System audio (clients)
         # Simple heuristic: look for therapeutic language patterns
-        therapeutic_phrases = [
-            "how does that make you feel",
-            "let's explore that",
-            "what comes up for you",
-            "can you tell me more",
-            "i'm hearing",
-            "it sounds like"
-        ]
-
-        text_lower = text.lower()
-        if any(phrase in text_lower for phrase in therapeutic_phrases):
+        if _THERAPY_RE.search(text):
             return "THERAPIST"
 
         # Default to first client for system audio channel
-        client_speakers = [name for name, info in self.current_session_speakers.items()
-                         if info['role'] == 'client']
-        return client_speakers[0] if client_speakers else "CLIENT"
+        return next((name for name, role in self._role_by_speaker.items() if role == 'client'), "CLIENT")
 
     def manual_speaker_correction(self, transcript_id: int, correct_speaker: str):
         """Manually correct speaker identification"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        self.flush()
 
-        cursor.execute('''
-            UPDATE transcripts
-            SET speaker_name = ?, speaker_role = ?
-            WHERE id = ?
-        ''', (correct_speaker,
-              self.current_session_speakers.get(correct_speaker, {}).get('role', 'unknown'),
-              transcript_id))
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
 
-        conn.commit()
-        conn.close()
+            cursor.execute('''
+                UPDATE transcripts
+                SET speaker_name = ?, speaker_role = ?
+                WHERE id = ?
+            ''', (correct_speaker,
+                  self._role_by_speaker.get(correct_speaker, 'unknown'),
+                  transcript_id))
 
     def add_transcript_segment(self, session_id: int, text: str, speaker: str,
                              timestamp: float, confidence: float = 0.0):
-        """Add a transcript segment to the database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        """Queue a transcript segment for the background writer.
 
-        speaker_info = self.current_session_speakers.get(speaker, {})
-        speaker_role = speaker_info.get('role', 'unknown')
+        Returns a Future that resolves to the row id once the segment is written.
+        """
+        speaker_role = self._role_by_speaker.get(speaker, 'unknown')
+        future = Future()
+
+        with self._writer_state_lock:
+            if self._writer_closed:
+                raise RuntimeError("SpeakerManager is closed")
+            self._write_q.put((future, (session_id, timestamp, speaker, speaker_role, text, confidence)))
+        return future
+
+    def flush(self):
+        """Block until all queued transcript segments are written (no-op once closed)"""
+        with self._writer_state_lock:
+            if self._writer_closed:
+                return
+            self._write_q.put(_FLUSH)
+        self._write_q.join()
+
+    def _writer_loop(self):
+        """Background writer: insert queued rows in batches of up to TRANSCRIPT_BATCH_SIZE"""
+        while True:
+            batch = []
+            item = self._write_q.get()
+            deadline = time.monotonic() + TRANSCRIPT_FLUSH_INTERVAL
+
+            # Collect rows until a marker, a full batch, or the flush interval elapses
+            while item is not _FLUSH and item is not _STOP:
+                batch.append(item)
+                item = None
+                remaining = deadline - time.monotonic()
+                if len(batch) >= TRANSCRIPT_BATCH_SIZE or remaining <= 0:
+                    break
+                try:
+                    item = self._write_q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write_batch(batch)
+
+            for _ in batch:
+                self._write_q.task_done()
+            if item is not None:
+                self._write_q.task_done()
+            if item is _STOP:
+                return
+
+    def _write_batch(self, batch):
+        """Insert a batch in one transaction; if it fails, retry row by row so one bad row can't drop the rest"""
+        try:
+            with self._lock, self._conn:
+                row_ids = [self._conn.execute(_SQL_INSERT_TRANSCRIPT, row).lastrowid for _, row in batch]
+        except Exception as e:
+            self.logger.warning(f"Batch write of {len(batch)} transcript segments failed ({e}); retrying individually")
+        else:
+            for (future, _), row_id in zip(batch, row_ids):
+                future.set_result(row_id)
+            return
+
+        for future, row in batch:
+            try:
+                with self._lock, self._conn:
+                    future.set_result(self._conn.execute(_SQL_INSERT_TRANSCRIPT, row).lastrowid)
+            except Exception as e:
+                self.logger.error(f"Failed to write transcript segment: {e}")
+                future.set_exception(e)
 
-        cursor.execute('''
-            INSERT INTO transcripts
-            (session_id, timestamp, speaker_name, speaker_role, text, confidence)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (session_id, timestamp, speaker, speaker_role, text, confidence))
+    def get_session_transcript(self, session_id: int) -> List[Dict]:
+        """Get complete transcript for a session"""
+        self.flush()
 
-        transcript_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        return transcript_id
+            cursor.execute(_SQL_SELECT_TRANSCRIPT, (session_id,))
+
+            transcript = []
+            for row in cursor.fetchall():
+                transcript.append({
+                    'id': row[0],
+                    'timestamp': row[1],
+                    'speaker': row[2],
+                    'role': row[3],
+                    'text': row[4],
+                    'confidence': row[5]
+                })
 
-    def get_session_transcript(self, session_id: int) -> List[Dict]:
-        """Get complete transcript for a session"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT id, timestamp, speaker_name, speaker_role, text, confidence
-            FROM transcripts
-            WHERE session_id = ?
-            ORDER BY timestamp ASC
-        ''', (session_id,))
-
-        transcript = []
-        for row in cursor.fetchall():
-            transcript.append({
-                'id': row[0],
-                'timestamp': row[1],
-                'speaker': row[2],
-                'role': row[3],
-                'text': row[4],
-                'confidence': row[5]
-            })
-
-        conn.close()
         return transcript
 
     def format_transcript_for_analysis(self, session_id: int, last_minutes: int = None) -> str:
         """Format transcript for AI analysis"""
-        transcript = self.get_session_transcript(session_id)
+        # Filter to last N minutes and build the lines in SQL
+        cutoff_time = time.time() - (last_minutes * 60) if last_minutes else None
 
-        if last_minutes:
-            # Filter to last N minutes
-            current_time = time.time()
-            cutoff_time = current_time - (last_minutes * 60)
-            transcript = [t for t in transcript if t['timestamp'] >= cutoff_time]
+        self.flush()
+        with self._lock:
+            cursor = self._conn.execute(_SQL_FORMAT_TRANSCRIPT, (session_id, cutoff_time, cutoff_time))
 
-        formatted_lines = []
-        for segment in transcript:
-            speaker_tag = f"[{segment['speaker']}]"
-            formatted_lines.append(f"{speaker_tag}: {segment['text']}")
-
-        return "\n".join(formatted_lines)
+            # Stream lines straight off the cursor; no intermediate row list
+            return "\n".join(line for (line,) in cursor)
 
     def get_session_summary(self, session_id: int) -> Dict:
         """Get summary statistics for a session"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-
-        # Get session info
-        cursor.execute('''
-            SELECT session_date, client_count, session_type, duration_minutes, status
-            FROM sessions WHERE id = ?
-        ''', (session_id,))
-
-        session_info = cursor.fetchone()
-
-        # Get speaker participation
-        cursor.execute('''
-            SELECT speaker_name, COUNT(*) as segment_count,
-                   SUM(LENGTH(text)) as total_characters
-            FROM transcripts
-            WHERE session_id = ?
-            GROUP BY speaker_name
-        ''', (session_id,))
+        self.flush()
 
-        speaker_stats = {}
-        for row in cursor.fetchall():
-            speaker_stats[row[0]] = {
-                'segments': row[1],
-                'characters': row[2]
-            }
+        # Session info and per-speaker participation in one query
+        with self._lock:
+            rows = self._conn.execute(_SQL_SESSION_SUMMARY, (session_id,)).fetchall()
 
-        conn.close()
+        session_info = rows[0][:5] if rows else None
+
+        speaker_stats = {}
+        for row in rows:
+            if row[5] is not None:
+                speaker_stats[row[5]] = {
+                    'segments': row[6],
+                    'characters': row[7]
+                }
 
         return {
             'session_info': session_info,
             'speaker_participation': speaker_stats,
-            'total_speakers': len(self.current_session_speakers)
+            'total_speakers': len(self._role_by_speaker)
         }
 
     def end_session(self, session_id: int, notes: str = ""):
         """End a therapy session"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        self.flush()
 
-        # Calculate session duration
-        cursor.execute('''
-            SELECT MIN(timestamp), MAX(timestamp)
-            FROM transcripts WHERE session_id = ?
-        ''', (session_id,))
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
 
-        result = cursor.fetchone()
-        duration = 0
-        if result[0] and result[1]:
-            duration = (result[1] - result[0]) / 60  # Convert to minutes
+            # Calculate session duration
+            cursor.execute('''
+                SELECT MIN(timestamp), MAX(timestamp)
+                FROM transcripts WHERE session_id = ?
+            ''', (session_id,))
 
-        cursor.execute('''
-            UPDATE sessions
-            SET status = 'completed', notes = ?, duration_minutes = ?
-            WHERE id = ?
-        ''', (notes, duration, session_id))
+            result = cursor.fetchone()
+            duration = 0
+            if result[0] and result[1]:
+                duration = (result[1] - result[0]) / 60  # Convert to minutes
 
-        conn.commit()
-        conn.close()
+            cursor.execute('''
+                UPDATE sessions
+                SET status = 'completed', notes = ?, duration_minutes = ?
+                WHERE id = ?
+            ''', (notes, duration, session_id))
 
         self.current_session_speakers = {}
+        self._role_by_speaker = {}
 
     def get_recent_sessions(self, limit: int = 10) -> List[Dict]:
         """Get recent therapy sessions"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT id, session_date, client_count, session_type,
-                   duration_minutes, status, notes
-            FROM sessions
-            ORDER BY session_date DESC
-            LIMIT ?
-        ''', (limit,))
-
-        sessions = []
-        for row in cursor.fetchall():
-            sessions.append({
-                'id': row[0],
-                'date': row[1],
-                'client_count': row[2],
-                'type': row[3],
-                'duration': row[4],
-                'status': row[5],
-                'notes': row[6]
-            })
-
-        conn.close()
-        return sessions
\ No newline at end of file
+        with self._lock:
+            cursor = self._conn.cursor()
+
+            cursor.execute('''
+                SELECT id, session_date, client_count, session_type,
+                       duration_minutes, status, notes
+                FROM sessions
+                ORDER BY session_date DESC
+                LIMIT ?
+            ''', (limit,))
+
+            sessions = []
+            for row in cursor.fetchall():
+                sessions.append({
+                    'id': row[0],
+                    'date': row[1],
+                    'client_count': row[2],
+                    'type': row[3],
+                    'duration': row[4],
+                    'status': row[5],
+                    'notes': row[6]
+                })
+
+        return sessions
+
+    def close(self):
+        """Write pending segments, stop the writer and close the database connection"""
+        with self._writer_state_lock:
+            if self._writer_closed:
+                return
+            self._writer_closed = True
+            self._write_q.put(_STOP)
+        self._writer_thread.join()
+
+        with self._lock:
+            self._conn.close()
@@ -3,19 +3,64 @@
 Test script to verify audio device selection and recording fixes
 """
 
+import functools
+import logging
+import sys
+import threading
+
+log = logging.getLogger("amanuensis.tests")
+
+_audio_manager = None
+_audio_manager_lock = threading.Lock()
+
+
+def _get_audio_manager():
+    """One AudioManager shared by every test in this module"""
+    global _audio_manager
+    with _audio_manager_lock:
+        if _audio_manager is None:
+            from audio_manager import AudioManager
+            _audio_manager = AudioManager()
+        return _audio_manager
+
+
+def teardown_module(module=None):
+    """Release the shared AudioManager once, after the last test (pytest calls this by name)"""
+    global _audio_manager
+    with _audio_manager_lock:
+        if _audio_manager is not None:
+            # stop_recording() only: cleanup() also deletes temp_recordings/*.wav, the app's saved recordings
+            _audio_manager.stop_recording()
+            _audio_manager = None
+    _get_devices.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_devices():
+    """Enumerate devices once; every test filters this result instead of probing again"""
+    return _get_audio_manager().get_audio_devices()
+
+
+def _input_devices():
+    return [d for d in _get_devices()['input_devices'] if d['channels'] > 0]
+
+
+def _system_devices():
+    system_devices = list(_get_devices()['system_recording_devices'])
+    if not system_devices:
+        # Rare path: let AudioManager apply its Stereo Mix / placeholder fallbacks
+        system_devices = _get_audio_manager().get_system_audio_devices()
+    return system_devices
+
 def test_device_filtering():
     """Test proper device filtering"""
     print("Testing Device Filtering")
     print("=" * 50)
 
     try:
-        from audio_manager import AudioManager
-
-        audio_manager = AudioManager()
-
         # Test getting input devices (should only return devices with input channels > 0)
         print("\nTesting input device filtering...")
-        input_devices = audio_manager.get_input_devices()
+        input_devices = _get_devices()['input_devices']
 
         print(f"Found {len(input_devices)} input devices:")
         for device in input_devices:
@@ -26,7 +71,7 @@ def test_device_filtering():
 
         # Test getting system audio devices
         print("\nTesting system audio device filtering...")
-        system_devices = audio_manager.get_system_audio_devices()
+        system_devices = _system_devices()
 
         print(f"Found {len(system_devices)} system audio devices:")
         for device in system_devices:
@@ -40,8 +85,7 @@ def test_device_filtering():
 
     except Exception as e:
         print(f"ERROR: Device filtering test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Device filtering test failed")
         return False
 
 def test_device_validation():
@@ -50,13 +94,11 @@ def test_device_validation():
     print("=" * 50)
 
     try:
-        from audio_manager import AudioManager
-
-        audio_manager = AudioManager()
+        audio_manager = _get_audio_manager()
 
         # Get devices for testing
-        input_devices = audio_manager.get_input_devices()
-        system_devices = audio_manager.get_system_audio_devices()
+        input_devices = _input_devices()
+        system_devices = _system_devices()
 
         if not input_devices:
             print("WARNING: No input devices available for testing")
@@ -108,8 +150,7 @@ def test_device_validation():
 
     except Exception as e:
         print(f"ERROR: Device validation test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Device validation test failed")
         return False
 
 def test_channel_validation():
@@ -118,15 +159,11 @@ def test_channel_validation():
     print("=" * 50)
 
     try:
-        from audio_manager import AudioManager
-
-        audio_manager = AudioManager()
-
         # Test the internal device validation
         print("Testing device channel validation...")
 
         # Try to get device info and validate
-        devices = audio_manager.get_audio_devices()
+        devices = _get_devices()
 
         input_count = 0
         output_count = 0
@@ -154,8 +191,7 @@ def test_channel_validation():
 
     except Exception as e:
         print(f"ERROR: Channel validation test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Channel validation test failed")
         return False
 
 def main():
@@ -174,14 +210,19 @@ def main():
     # Test 1: Device Filtering
     filtering_success = test_device_filtering()
     results.append(("Device Filtering", filtering_success))
+    sys.stdout.flush()
 
     # Test 2: Device Validation
     validation_success = test_device_validation()
     results.append(("Device Validation", validation_success))
+    sys.stdout.flush()
 
     # Test 3: Channel Validation
     channel_success = test_channel_validation()
     results.append(("Channel Validation", channel_success))
+    sys.stdout.flush()
+
+    teardown_module()
 
     # Summary
     print("\n" + "=" * 60)
@@ -206,4 +247,7 @@ def main():
         print("\nSome tests failed - check the output above for details")
 
 if __name__ == "__main__":
+    # Block-buffer stdout so each test's device listing goes out in one write at its flush
+    sys.stdout.reconfigure(line_buffering=False)
+    logging.basicConfig(stream=sys.stderr, level=logging.INFO)
     main()
\ No newline at end of file
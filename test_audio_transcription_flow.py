@@ -12,6 +12,7 @@ from collections import defaultdict
 
 # Set up logging to see the flow
 logging.basicConfig(level=logging.INFO, format='%(name)s | %(levelname)s | %(message)s')
+log = logging.getLogger("amanuensis.tests")
 
 def test_complete_flow():
     """Test the complete audio transcription pipeline"""
@@ -48,10 +49,12 @@ def test_complete_flow():
 
         # 4. Set up result tracking
         results_received = []
+        result_arrived = threading.Event()
 
         def result_callback(result):
             """Callback to receive transcription results"""
             results_received.append(result)
+            result_arrived.set()
             print(f"   [TRANSCRIPT] Transcription result: {len(result.segments) if hasattr(result, 'segments') else 0} segments")
             if hasattr(result, 'segments'):
                 for segment in result.segments:
@@ -85,37 +88,58 @@ def test_complete_flow():
 
         print(f"   Injecting {total_chunks} audio chunks ({duration}s of audio)...")
 
-        for i in range(total_chunks):
-            # Create a chunk of audio
-            start_sample = i * chunk_size
-            end_sample = min(start_sample + chunk_size, samples)
-            chunk_samples = end_sample - start_sample
+        # Generate the whole test signal up front (mix of tones to simulate speech-like signal)
+        n = np.arange(samples)
 
-            # Generate test audio (mix of tones to simulate speech-like signal)
-            t = np.linspace(start_sample/sample_rate, end_sample/sample_rate, chunk_samples, False)
+        # Create stereo audio (mic + system audio simulation), interleaved frame by frame
+        # Left channel: 440Hz tone (simulated mic)
+        # Right channel: 880Hz tone (simulated system audio)
+        # Integer tone frequencies repeat every sample_rate samples, so one second of sine is an exact
+        # lookup table and each channel is a gather at integer phase (freq * n) % sample_rate
+        sine_table = (0.1 * np.sin(np.arange(sample_rate) * (2 * np.pi / sample_rate))).astype(np.float32)
+        stereo_full = np.empty((samples, 2), dtype=np.float32)
+        for channel, freq in enumerate((440, 880)):
+            stereo_full[:, channel] = sine_table[(freq * n) % sample_rate]
 
-            # Create stereo audio (mic + system audio simulation)
-            # Left channel: 440Hz tone (simulated mic)
-            # Right channel: 880Hz tone (simulated system audio)
-            left_channel = 0.1 * np.sin(2 * np.pi * 440 * t)
-            right_channel = 0.1 * np.sin(2 * np.pi * 880 * t)
+        def _produce(stereo_full, sample_rate, chunk_size):
+            """Producer thread: feed pre-built chunks to the callbacks on a monotonic deadline"""
+            chunk_duration = chunk_size / sample_rate
 
-            # Interleave to stereo
-            stereo_audio = np.empty(chunk_samples * 2, dtype=np.float32)
-            stereo_audio[0::2] = left_channel  # Left channel
-            stereo_audio[1::2] = right_channel  # Right channel
+            # Bind hot-loop callables to locals once
+            call_audio_callbacks = audio_manager._call_audio_callbacks
+            perf_counter = time.perf_counter
+            sleep = time.sleep
 
-            # Call the audio callback (this simulates AudioManager sending audio)
-            audio_manager._call_audio_callbacks(stereo_audio, sample_rate)
+            deadline = perf_counter()
 
-            if i % 10 == 0:  # Progress update every 10 chunks
-                print(f"   Processed chunk {i+1}/{total_chunks}")
+            for i in range(total_chunks):
+                # Slice this chunk out of the pre-built signal
+                stereo_audio = stereo_full[i * chunk_size:(i + 1) * chunk_size].ravel()
 
-            time.sleep(0.01)  # Small delay between chunks
+                # Call the audio callback (this simulates AudioManager sending audio)
+                call_audio_callbacks(stereo_audio, sample_rate)
 
-        print("   [OK] Audio injection completed")
+                if i & 31 == 0:  # Progress update every 32 chunks
+                    print(f"   Processed chunk {i+1}/{total_chunks}")
 
-        # 7. Check the queue status
+                # Sleep only when ahead of schedule; a late chunk is followed immediately by the next
+                deadline += chunk_duration
+                slack = deadline - perf_counter()
+                if slack > 0.001:
+                    sleep(slack)
+
+            print("   [OK] Audio injection completed")
+
+        # Inject from a producer thread so the main thread can watch the queue and results meanwhile
+        initial_results = len(results_received)
+        result_arrived.clear()
+        producer = threading.Thread(
+            target=_produce, args=(stereo_full, sample_rate, chunk_size), name="AudioProducer", daemon=True
+        )
+        producer.start()
+
+        # 7. Check the queue status (mid-stream)
+        time.sleep(1)
         print("\n4. Checking audio queue status...")
         from audio_transcription_bridge import audio_q
 
@@ -123,33 +147,32 @@ def test_complete_flow():
         print(f"   Audio queue size: {queue_size} packets")
 
         if queue_size > 0:
-            # Peek at a queue packet
+            # Peek at the head packet under the queue's own lock, leaving it in place for the consumer
             try:
-                packet = audio_q.get_nowait()
+                with audio_q.mutex:
+                    packet = audio_q.queue[0]
                 print(f"   Sample packet: t={packet['t']:.3f}, sr={packet['sr']}, data_shape={packet['data'].shape}")
-                # Put it back
-                audio_q.put_nowait(packet)
-            except:
+            except IndexError:
                 pass
 
-        # 8. Wait for transcription results
+        # 8. Wait for transcription results while audio is still flowing
         print("\n5. Waiting for transcription results...")
-        initial_results = len(results_received)
 
-        # Wait up to 30 seconds for results
+        # Wait up to 30 seconds past the end of the injected audio for results
+        # Block on the callback's event; wake every 5 seconds only to print progress
         wait_time = 0
-        max_wait = 30
+        max_wait = 30 + int(duration)
 
         while wait_time < max_wait:
-            current_results = len(results_received)
-            if current_results > initial_results:
-                print(f"   [OK] Received {current_results - initial_results} new transcription results")
+            tick = min(5, max_wait - wait_time)
+            if result_arrived.wait(timeout=tick):
+                print(f"   [OK] Received {len(results_received) - initial_results} new transcription results")
                 break
 
-            time.sleep(1)
-            wait_time += 1
-            if wait_time % 5 == 0:
-                print(f"   Waiting for results... ({wait_time}s elapsed)")
+            wait_time += tick
+            print(f"   Waiting for results... ({wait_time}s elapsed)")
+
+        producer.join()
 
         # 9. Final status
         print("\n6. Final Results:")
@@ -199,10 +222,38 @@ def test_complete_flow():
 
     except Exception as e:
         print(f"\n[ERROR] FLOW TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Flow test failed")
+        return False
+
+def test_audio_queue_wraparound():
+    """Overfill the bridge's drop-oldest queue and check it keeps the newest packets in order"""
+    print("\nTesting audio queue wrap-around...")
+
+    from audio_transcription_bridge import _DropOldestQueue
+
+    q = _DropOldestQueue(maxsize=4)
+    dropped = [q.put_overwrite(i) for i in range(10)]
+
+    assert dropped == [False] * 4 + [True] * 6, f"Unexpected drop pattern: {dropped}"
+    assert q.qsize() == 4, f"Queue grew past its bound: {q.qsize()}"
+    kept = [q.get_nowait() for _ in range(4)]
+    assert kept == [6, 7, 8, 9], f"Oldest packets not evicted first: {kept}"
+
+    print("   [OK] Queue stays bounded and evicts oldest packets first")
+
+def _run_wraparound():
+    """Script entry for test_audio_queue_wraparound: report a failure instead of raising"""
+    try:
+        test_audio_queue_wraparound()
+        return True
+    except Exception as e:
+        print(f"   [ERROR] Queue wrap-around test failed: {e}")
+        log.exception("Queue wrap-around test failed")
         return False
 
 if __name__ == "__main__":
-    success = test_complete_flow()
+    # Run both so a queue failure doesn't hide the full-flow result
+    wrap_ok = _run_wraparound()
+    flow_ok = test_complete_flow()
+    success = wrap_ok and flow_ok
     exit(0 if success else 1)
\ No newline at end of file
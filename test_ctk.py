@@ -14,6 +14,9 @@ def test_basic_components():
     root.title("CTK Test")
     root.geometry("400x300")
 
+    # Keep the window unmapped while building so the packs resolve in one layout pass
+    root.withdraw()
+
     # Test basic components
     frame = ctk.CTkFrame(root)
     frame.pack(padx=20, pady=20)
@@ -40,8 +43,11 @@ def test_basic_components():
     print("All components created successfully!")
     print("CustomTkinter version:", ctk.__version__ if hasattr(ctk, '__version__') else "Unknown")
 
+    root.update_idletasks()
+    root.deiconify()
+
     # Close immediately for automated testing
-    root.after(1000, root.destroy)
+    root.after(0, root.destroy)
     root.mainloop()
 
 if __name__ == "__main__":
@@ -3,6 +3,22 @@
 Test script to verify CUDA detection and model loading fixes for Amanuensis
 """
 
+import functools
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+log = logging.getLogger("amanuensis.tests")
+
+@functools.lru_cache(maxsize=None)
+def _cuda_info():
+    """(GPU name, total memory in bytes) for device 0, or None without CUDA; probed once per run"""
+    import torch
+    if not torch.cuda.is_available():
+        return None
+    props = torch.cuda.get_device_properties(0)
+    return torch.cuda.get_device_name(), props.total_memory
+
 def test_cuda_detection():
     """Test CUDA detection in transcription config"""
     print("Testing CUDA Detection")
@@ -19,11 +35,12 @@ def test_cuda_detection():
 
         # Test PyTorch CUDA directly
         try:
-            import torch
-            print(f"PyTorch CUDA available: {torch.cuda.is_available()}")
-            if torch.cuda.is_available():
-                print(f"GPU name: {torch.cuda.get_device_name()}")
-                print(f"GPU memory: {torch.cuda.get_device_properties(0).total_memory / (1024**3):.1f}GB")
+            cuda_info = _cuda_info()
+            print(f"PyTorch CUDA available: {cuda_info is not None}")
+            if cuda_info:
+                gpu_name, gpu_memory = cuda_info
+                print(f"GPU name: {gpu_name}")
+                print(f"GPU memory: {gpu_memory / (1024**3):.1f}GB")
         except ImportError:
             print("PyTorch not available")
 
@@ -72,8 +89,7 @@ def test_model_manager():
 
     except Exception as e:
         print(f"ERROR: Model manager test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Model manager test failed")
         return False
 
 def test_model_recommendation():
@@ -88,6 +104,12 @@ def test_model_recommendation():
         recommended = config.get_model_recommendation()
 
         print(f"Recommended model: {recommended}")
+        try:
+            cuda_info = _cuda_info()
+            if cuda_info:
+                print(f"For GPU: {cuda_info[0]} ({cuda_info[1] / (1024**3):.1f}GB)")
+        except ImportError:
+            pass
 
         # Check if it makes sense for RTX 5060 Ti with 16GB
         if recommended in ['large-v3', 'medium']:
@@ -108,36 +130,45 @@ def test_faster_whisper_direct():
 
     try:
         from faster_whisper import WhisperModel
-        import tempfile
         import numpy as np
-        import soundfile as sf
 
         print("Creating test model on CUDA...")
 
-        # Try to create a model on CUDA
-        model = WhisperModel(
-            "tiny",
-            device="cuda",
-            compute_type="float16",
-            local_files_only=True  # Use cached if available
-        )
-
-        print("SUCCESS: Model loaded on CUDA")
+        # Try to create a model on CUDA with int8 weights / fp16 activations (the fastest quantized path)
+        compute_type = "int8_float16"
+        try:
+            model = WhisperModel(
+                "tiny",
+                device="cuda",
+                compute_type=compute_type,
+                local_files_only=True  # Use cached if available
+            )
+        except ValueError:
+            # GPU without efficient INT8 support; CTranslate2 rejects the compute type up front
+            compute_type = "float16"
+            model = WhisperModel(
+                "tiny",
+                device="cuda",
+                compute_type=compute_type,
+                local_files_only=True
+            )
+
+        print(f"SUCCESS: Model loaded on CUDA ({compute_type})")
 
         # Create test audio
         sample_rate = 16000
         duration = 1
-        test_audio = np.random.random(sample_rate * duration).astype(np.float32) * 0.1
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            sf.write(temp_file.name, test_audio, sample_rate)
+        rng = np.random.default_rng(0)  # Seeded so every run feeds the model the same noise
+        test_audio = rng.random(sample_rate * duration, dtype=np.float32)
+        test_audio *= 0.1
 
-            print("Testing transcription...")
-            segments, info = model.transcribe(temp_file.name, beam_size=1)
-            segments_list = list(segments)
+        # 16 kHz mono float32 goes straight to the model; fixing the language skips detection
+        print("Testing transcription...")
+        segments, info = model.transcribe(test_audio, beam_size=1, language='en')
+        segments_list = list(segments)
 
-            print(f"SUCCESS: Transcription completed, {len(segments_list)} segments")
-            print(f"Language detected: {info.language}")
+        print(f"SUCCESS: Transcription completed, {len(segments_list)} segments")
+        print(f"Language: {info.language}")
 
         del model
         print("Model cleanup completed")
@@ -160,19 +191,26 @@ def main():
 
     results = []
 
+    # Tests 1-3 are independent read-only queries, so they share one CUDA context concurrently
+    # (their progress output may interleave)
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        detection = ex.submit(test_cuda_detection)
+        manager = ex.submit(test_model_manager)
+        recommendation = ex.submit(test_model_recommendation)
+
     # Test 1: CUDA Detection
-    device, compute_type = test_cuda_detection()
+    device, compute_type = detection.result()
     results.append(("CUDA Detection", device == "cuda" if device else False))
 
     # Test 2: Model Manager
-    model_success = test_model_manager()
+    model_success = manager.result()
     results.append(("Model Manager", model_success))
 
     # Test 3: Model Recommendation
-    rec_success = test_model_recommendation()
+    rec_success = recommendation.result()
     results.append(("Model Recommendation", rec_success))
 
-    # Test 4: Direct faster-whisper (if models available)
+    # Test 4: Direct faster-whisper (if models available); run alone since it allocates on the GPU
     direct_success = test_faster_whisper_direct()
     results.append(("Direct CUDA Test", direct_success))
 
@@ -197,4 +235,5 @@ def main():
         print("\nISSUE: CUDA not being detected - check PyTorch installation")
 
 if __name__ == "__main__":
+    logging.basicConfig(stream=sys.stderr, level=logging.INFO)
     main()
\ No newline at end of file
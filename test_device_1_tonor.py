@@ -3,15 +3,23 @@
 Test device index 1 (TONOR) specifically to verify the original error is fixed
 """
 
+import functools
 import time
 from audio_manager import AudioManager
 
+def _cache_device_enumeration(audio_manager):
+    """Memoize get_audio_devices() on this instance; call audio_manager.clear_device_cache() after a hot-plug"""
+    cached = functools.lru_cache(maxsize=1)(audio_manager.get_audio_devices)
+    audio_manager.get_audio_devices = cached  # get_input_devices()/get_system_audio_devices() go through this too
+    audio_manager.clear_device_cache = cached.cache_clear
+    return audio_manager
+
 def test_device_1_tonor():
     """Test device index 1 (TONOR) to verify the original 'pa' error is fixed"""
     print("Testing device index 1 (TONOR) - Original error case...")
 
     try:
-        audio_manager = AudioManager()
+        audio_manager = _cache_device_enumeration(AudioManager())
 
         # Get devices
         devices = audio_manager.get_audio_devices()
@@ -19,16 +27,18 @@ def test_device_1_tonor():
         for i, mic in enumerate(devices['input_devices']):
             print(f"  {i}: {mic['name']}")
 
+        # Skip before any device open when this machine has no TONOR at index 1
+        input_devices = devices['input_devices']
+        if len(input_devices) <= 1 or 'TONOR' not in input_devices[1]['name'].upper():
+            print("\nSKIPPED: device index 1 is not a TONOR microphone on this machine")
+            return None
+
         # Test setting device index 1 specifically (this was failing before)
+        # set_input_device is the compatibility wrapper and delegates to set_microphone_device
         print("\nAttempting to set input device 1 (original error case)...")
         success, msg = audio_manager.set_input_device(1)  # This should now work via compatibility wrapper
         print(f"set_input_device(1) result: {success}, {msg}")
 
-        # Also test direct microphone device setting
-        print("\nTesting direct microphone device setting...")
-        success, msg = audio_manager.set_microphone_device(1)  # Direct soundcard method
-        print(f"set_microphone_device(1) result: {success}, {msg}")
-
         # Set a system audio device
         if devices['system_recording_devices']:
             speaker_name = devices['system_recording_devices'][0]['raw_name']
@@ -61,4 +71,5 @@ def test_device_1_tonor():
 
 if __name__ == "__main__":
     success = test_device_1_tonor()
-    print(f"\nDevice 1 (TONOR) Test: {'PASSED' if success else 'FAILED'}")
\ No newline at end of file
+    status = 'SKIPPED' if success is None else 'PASSED' if success else 'FAILED'
+    print(f"\nDevice 1 (TONOR) Test: {status}")
\ No newline at end of file
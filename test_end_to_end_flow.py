@@ -5,12 +5,23 @@ Tests the complete pipeline: Audio Manager -> Transcription Bridge -> Whisper Ma
 """
 
 import logging
+import queue
 import time
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 
+_RNG = np.random.default_rng()
+
+# Recycled frame buffers for step 6: taken before a push, handed back once the consumer is done
+FRAME_SIZE = 1024
+_FRAME_POOL = [np.empty(FRAME_SIZE, dtype=np.float32) for _ in range(8)]
+
+def _take_frame():
+    return _FRAME_POOL.pop() if _FRAME_POOL else np.empty(FRAME_SIZE, dtype=np.float32)
+
 def test_end_to_end_pipeline():
     """Test the complete audio transcription pipeline"""
 
@@ -34,121 +45,150 @@ def test_end_to_end_pipeline():
 
         print("[OK] All managers created")
 
-        # 2. Check available devices
-        print("\n2. Checking audio devices...")
-
-        input_devices = audio_manager.get_input_devices()
-        system_devices = audio_manager.get_system_audio_devices()
-
-        print(f"[INFO] Input devices: {len(input_devices)}")
-        for device in input_devices[:3]:  # Show first 3
-            print(f"   - {device['name']} (index {device['index']})")
-
-        print(f"[INFO] System devices: {len(system_devices)}")
-        for device in system_devices:
-            print(f"   - {device['name']} (index {device['index']})")
-
-        # 3. Test model loading
-        print("\n3. Testing model loading...")
-
-        model_status = whisper_manager.get_model_status()
-        print(f"[INFO] Model available: {model_status['available']}")
-        print(f"[INFO] Model loaded: {model_status['loaded']}")
-
-        if not model_status['loaded']:
-            print("[INFO] Loading model...")
-            success = whisper_manager.load_model()
-            if success:
-                print("[OK] Model loaded successfully")
-            else:
-                print("[ERROR] Model loading failed")
-                return False
-
-        # 4. Test audio transcription bridge
-        print("\n4. Testing transcription bridge...")
+        # Start the (slow) model load now so it overlaps device enumeration and the bridge checks
+        preload = ThreadPoolExecutor(max_workers=1, thread_name_prefix='model-preload')
+        load_future = None
+        if not whisper_manager.get_model_status()['loaded']:
+            load_future = preload.submit(whisper_manager.load_model)
+        preload.shutdown(wait=False)
 
         try:
-            from audio_transcription_bridge import AudioTranscriptionBridge
-            bridge = AudioTranscriptionBridge(audio_manager, whisper_manager)
-            print("[OK] Transcription bridge created")
-        except Exception as e:
-            print(f"[ERROR] Bridge creation failed: {e}")
-            return False
+            # 2. Check available devices
+            print("\n2. Checking audio devices...")
 
-        # 5. Test WASAPI loopback detection
-        print("\n5. Testing WASAPI loopback...")
+            # Enumerate once and derive both views; fall back to AudioManager's system-device search
+            devices = audio_manager.get_audio_devices()
+            input_devices = devices['input_devices']
+            system_devices = devices['system_recording_devices'] or audio_manager.get_system_audio_devices()
 
-        try:
-            from audio_transcription_bridge import resolve_loopback_mic, preflight_loopback
-            mic, spk = resolve_loopback_mic()
-            print(f"[OK] Loopback devices resolved: {spk.name}")
+            print(f"[INFO] Input devices: {len(input_devices)}")
+            for device in input_devices[:3]:  # Show first 3
+                print(f"   - {device['name']} (index {device['index']})")
 
-            # Quick preflight test
-            preflight_loopback(mic)
-            print(f"[OK] Loopback preflight successful")
-        except Exception as e:
-            print(f"[WARN] Loopback test failed: {e}")
-            print("      This is expected if no system audio is playing")
+            print(f"[INFO] System devices: {len(system_devices)}")
+            for device in system_devices:
+                print(f"   - {device['name']} (index {device['index']})")
 
-        # 6. Test audio queue system
-        print("\n6. Testing audio queue system...")
+            # 3. Test model loading
+            print("\n3. Testing model loading...")
 
-        try:
-            from audio_transcription_bridge import push_audio_frames, audio_q
+            model_status = whisper_manager.get_model_status()
+            print(f"[INFO] Model available: {model_status['available']}")
+            print(f"[INFO] Model loaded: {model_status['loaded']}")
 
-            # Push test frames
-            test_audio = np.random.random(1024).astype('float32') * 0.1
-            push_audio_frames(test_audio, 44100)
+            if load_future is not None:
+                print("[INFO] Loading model in the background (awaited before transcription)...")
 
-            queue_size = audio_q.qsize()
-            print(f"[OK] Audio queue working, size: {queue_size}")
+            # 4. Test audio transcription bridge
+            print("\n4. Testing transcription bridge...")
 
-            # Consume the test frame
-            if queue_size > 0:
-                packet = audio_q.get_nowait()
-                print(f"[OK] Queue packet format: t={packet['t']:.3f}, sr={packet['sr']}, data_shape={packet['data'].shape}")
+            try:
+                from audio_transcription_bridge import AudioTranscriptionBridge
+                bridge = AudioTranscriptionBridge(audio_manager, whisper_manager)
+                print("[OK] Transcription bridge created")
+            except Exception as e:
+                print(f"[ERROR] Bridge creation failed: {e}")
+                return False
 
-        except Exception as e:
-            print(f"[ERROR] Audio queue test failed: {e}")
-            return False
+            # 5. Test WASAPI loopback detection
+            print("\n5. Testing WASAPI loopback...")
+
+            try:
+                from audio_transcription_bridge import resolve_loopback_mic, preflight_loopback
+                mic, spk = resolve_loopback_mic()
+                print(f"[OK] Loopback devices resolved: {spk.name}")
+
+                # Quick preflight test
+                preflight_loopback(mic)
+                print(f"[OK] Loopback preflight successful")
+            except Exception as e:
+                print(f"[WARN] Loopback test failed: {e}")
+                print("      This is expected if no system audio is playing")
+
+            # 6. Test audio queue system
+            print("\n6. Testing audio queue system...")
+
+            try:
+                from audio_transcription_bridge import push_audio_frames, audio_q
+
+                # Push a test frame generated in place into a pooled float32 buffer
+                test_audio = _take_frame()
+                _RNG.standard_normal(dtype=np.float32, out=test_audio)
+                test_audio *= np.float32(0.1)
+                push_audio_frames(test_audio, 44100)
+
+                # Consume the test frame in one non-blocking pop (no separate qsize() probe)
+                try:
+                    packet = audio_q.get_nowait()
+                    print("[OK] Audio queue working")
+                    print(f"[OK] Queue packet format: t={packet['t']:.3f}, sr={packet['sr']}, data_shape={packet['data'].shape}")
+                    if packet['data'] is test_audio:
+                        _FRAME_POOL.append(test_audio)  # Consumer is done with the borrowed buffer
+                except queue.Empty:
+                    print("[OK] Audio queue working, size: 0")
+
+            except Exception as e:
+                print(f"[ERROR] Audio queue test failed: {e}")
+                return False
 
-        # 7. Test transcription on synthetic audio
-        print("\n7. Testing transcription...")
+            # 7. Test transcription on synthetic audio
+            print("\n7. Testing transcription...")
+
+            if load_future is not None:
+                # Started in the background after step 1; a load exception is reported on its own
+                load_error = load_future.exception()
+                if load_error is not None:
+                    print(f"[ERROR] Model loading raised: {load_error}")
+                    return False
+                if load_future.result():
+                    print("[OK] Model loaded successfully")
+                else:
+                    print("[ERROR] Model loading failed")
+                    return False
+
+            try:
+                # Create synthetic audio (sine wave representing speech-like signal)
+                sample_rate = 16000
+                duration = 2.0
+                samples = int(sample_rate * duration)
+
+                # Mix of frequencies to simulate speech: A4 and A5, synthesized in one inverse real FFT.
+                # Both tones sit exactly on a bin (freq * duration), and a -j*amp*N/2 coefficient gives amp*sin
+                spectrum = np.zeros(samples // 2 + 1, dtype=np.complex64)
+                for freq, amp in ((440, 0.3), (880, 0.2)):
+                    spectrum[int(freq * duration)] = -0.5j * amp * samples
+                audio_data = np.fft.irfft(spectrum, n=samples).astype(np.float32, copy=False)
+
+                # Noise: uniform in [-0.05, 0.05)
+                noise = _RNG.random(samples, dtype=np.float32)
+                noise -= np.float32(0.5)
+                noise *= np.float32(0.1)
+                audio_data += noise
+
+                # Test transcription with synthetic audio
+                segments, info = whisper_manager.model.transcribe(
+                    audio_data,
+                    beam_size=1,
+                    language="en"
+                )
+
+                segment_list = list(segments)
+                print(f"[OK] Transcription test successful")
+                print(f"     Language: {info.language} (confidence: {info.language_probability:.2f})")
+                print(f"     Segments: {len(segment_list)}")
+
+                if segment_list:
+                    for i, segment in enumerate(segment_list[:2]):  # Show first 2 segments
+                        print(f"     Segment {i+1}: '{segment.text.strip()}' ({segment.start:.1f}s-{segment.end:.1f}s)")
+
+            except Exception as e:
+                print(f"[ERROR] Transcription test failed: {e}")
+                return False
 
-        try:
-            # Create synthetic audio (sine wave representing speech-like signal)
-            sample_rate = 16000
-            duration = 2.0
-            samples = int(sample_rate * duration)
-
-            # Create a simple audio signal
-            t = np.linspace(0, duration, samples, False)
-            # Mix of frequencies to simulate speech
-            audio_data = (0.3 * np.sin(2 * np.pi * 440 * t) +  # A4
-                         0.2 * np.sin(2 * np.pi * 880 * t) +  # A5
-                         0.1 * np.random.random(samples) - 0.05)  # Noise
-
-            audio_data = audio_data.astype(np.float32)
-
-            # Test transcription with synthetic audio
-            segments, info = whisper_manager.model.transcribe(
-                audio_data,
-                beam_size=1,
-                language="en"
-            )
-
-            segment_list = list(segments)
-            print(f"[OK] Transcription test successful")
-            print(f"     Language: {info.language} (confidence: {info.language_probability:.2f})")
-            print(f"     Segments: {len(segment_list)}")
-
-            if segment_list:
-                for i, segment in enumerate(segment_list[:2]):  # Show first 2 segments
-                    print(f"     Segment {i+1}: '{segment.text.strip()}' ({segment.start:.1f}s-{segment.end:.1f}s)")
-
-        except Exception as e:
-            print(f"[ERROR] Transcription test failed: {e}")
-            return False
+        finally:
+            # Early exits in steps 2-7 never collect the preload: drop it if it hasn't started
+            if load_future is not None and not load_future.done() and not load_future.cancel():
+                print("[INFO] Background model load still running; exit waits for it to finish")
 
         # 8. Test complete
         print("\n" + "=" * 60)
@@ -3,42 +3,43 @@
 Test script to verify the critical fixes for the transcription system
 """
 
+import importlib.util
+import io
 import os
 import sys
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
 def test_imports():
-    """Test that all required modules can be imported"""
+    """Test that all required modules are available (located, not executed)"""
     print("=" * 50)
     print("Testing Module Imports")
     print("=" * 50)
     
-    try:
-        # Test core modules
-        import transcription_config
-        print("✓ transcription_config imported successfully")
-        
-        import enhanced_whisper_manager
-        print("✓ enhanced_whisper_manager imported successfully")
-        
-        import audio_transcription_bridge
-        print("✓ audio_transcription_bridge imported successfully")
-        
-        import session_storage_manager
-        print("✓ session_storage_manager imported successfully")
-        
-        import whisper_model_downloader
-        print("✓ whisper_model_downloader imported successfully")
-        
-        return True
-        
-    except ImportError as e:
-        print(f"✗ Import error: {e}")
+    # find_spec locates each module without running its body, so this check doesn't pay for
+    # faster-whisper/CTranslate2 or audio backend loading; the tests below import what they exercise
+    modules = [
+        "transcription_config",
+        "enhanced_whisper_manager",
+        "audio_transcription_bridge",
+        "session_storage_manager",
+        "whisper_model_downloader",
+    ]
+    
+    missing = [name for name in modules if importlib.util.find_spec(name) is None]
+    for name in modules:
+        if name not in missing:
+            print(f"✓ {name} available")
+    
+    if missing:
+        print(f"✗ Import error: no module named {', '.join(missing)}")
         return False
+    return True
 
 def test_transcription_config():
     """Test transcription configuration"""
@@ -193,6 +194,32 @@ def test_faster_whisper_availability():
         print(f"✗ faster-whisper error: {e}")
         return False
 
+class _PerThreadStdout:
+    """sys.stdout stand-in that sends a worker thread's prints to its own buffer while one is set"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def _target(self):
+        return getattr(self._local, 'buffer', None) or self.stream
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def run_captured(self, test_func):
+        """Run test_func with this thread's output captured; returns (result, exception, output)"""
+        self._local.buffer = io.StringIO()
+        try:
+            return test_func(), None, self._local.buffer.getvalue()
+        except Exception as e:
+            return False, e, self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
 def main():
     """Run all tests"""
     print("🔧 AMANUENSIS TRANSCRIPTION SYSTEM - FIX VERIFICATION")
@@ -210,17 +237,29 @@ def main():
     passed = 0
     failed = 0
     
-    for test_name, test_func in tests:
-        try:
-            if test_func():
-                passed += 1
-                print(f"\n✅ {test_name}: PASSED")
-            else:
-                failed += 1
-                print(f"\n❌ {test_name}: FAILED")
-        except Exception as e:
+    # The module availability check runs first on its own; the remaining tests keep their state
+    # function-local and run concurrently with captured output
+    stdout = _PerThreadStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        outcomes = [stdout.run_captured(tests[0][1])]
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            outcomes += ex.map(lambda test: stdout.run_captured(test[1]), tests[1:])
+    finally:
+        sys.stdout = stdout.stream
+    
+    # Report in the original order so the output reads the same as a serial run
+    for (test_name, _), (result, error, output) in zip(tests, outcomes):
+        sys.stdout.write(output)
+        if error is not None:
+            failed += 1
+            print(f"\n❌ {test_name}: FAILED with exception: {error}")
+        elif result:
+            passed += 1
+            print(f"\n✅ {test_name}: PASSED")
+        else:
             failed += 1
-            print(f"\n❌ {test_name}: FAILED with exception: {e}")
+            print(f"\n❌ {test_name}: FAILED")
     
     print("\n" + "=" * 50)
     print("TEST SUMMARY")
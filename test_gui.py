@@ -6,19 +6,15 @@ Test just the GUI components of Amanuensis
 import customtkinter as ctk
 from tkinter import messagebox
 
-def main():
-    """Create and test a simplified GUI"""
-    print("Starting GUI test...")
-
-    # Set appearance
-    ctk.set_appearance_mode("dark")
-    ctk.set_default_color_theme("blue")
-
-    # Create main window
-    root = ctk.CTk()
-    root.title("Amanuensis GUI Test")
-    root.geometry("800x600")
-
+def set_textbox_text(textbox, text):
+    """Replace a read-only textbox's contents with one insert between a single unlock/lock pair"""
+    textbox.configure(state="normal")
+    textbox.delete("1.0", "end")
+    textbox.insert("1.0", text)
+    textbox.configure(state="disabled")
+
+def build_ui(root):
+    """Create the test widgets (scheduled from the event loop so the window appears first)"""
     # Header
     header = ctk.CTkFrame(root)
     header.pack(fill="x", padx=20, pady=20)
@@ -86,8 +82,7 @@ def main():
 
     insights = ctk.CTkTextbox(right, font=ctk.CTkFont(size=13))
     insights.pack(fill="both", expand=True, padx=20, pady=(0, 20))
-    insights.insert("0.0", "This is a test of the AI insights panel.\\n\\nAll GUI components are working correctly!")
-    insights.configure(state="disabled")
+    set_textbox_text(insights, "This is a test of the AI insights panel.\\n\\nAll GUI components are working correctly!")
 
     # Status bar
     status_frame = ctk.CTkFrame(root)
@@ -102,6 +97,23 @@ def main():
     status_label.pack(pady=10)
 
     print("GUI components created successfully!")
+
+def main():
+    """Create and test a simplified GUI"""
+    print("Starting GUI test...")
+
+    # Set appearance
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    # Create main window
+    root = ctk.CTk()
+    root.title("Amanuensis GUI Test")
+    root.geometry("800x600")
+
+    # Build the widgets once mainloop is running, so the first paint isn't held up by CTk theming
+    root.after_idle(build_ui, root)
+
     print("Close the window to exit...")
 
     # Run the GUI
@@ -45,10 +45,10 @@ def test_session_storage_fix():
             else:
                 print(f"Segment {i+1}: FAILED to save")
 
-            # Test that speakers is still a set after each save
+            # Test that speakers is still a list after each save
             speakers = storage.current_session['stats']['speakers']
-            if isinstance(speakers, set):
-                print(f"  Speakers type: SET (correct) - {speakers}")
+            if isinstance(speakers, list):
+                print(f"  Speakers type: LIST (correct) - {speakers}")
             else:
                 print(f"  Speakers type: {type(speakers)} (WRONG!) - {speakers}")
 
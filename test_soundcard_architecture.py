@@ -4,12 +4,20 @@ Test script for the new unified python-soundcard architecture
 This verifies that concurrent mic + loopback capture works properly
 """
 
+import math
 import time
 import numpy as np
 import threading
 import soundcard as sc
 from logger_config import get_logger
 
+def _rms_level(mono):
+    """RMS of a float chunk on the int16 scale, as a single dot product over the original samples"""
+    mono = np.ravel(mono)
+    if not mono.size:
+        return 0.0
+    return math.sqrt(float(np.dot(mono, mono)) / mono.size) * 32767.0
+
 def test_concurrent_soundcard_capture():
     """Test concurrent microphone and loopback capture using python-soundcard"""
     logger = get_logger('test_soundcard')
@@ -76,9 +84,7 @@ def test_concurrent_soundcard_capture():
                     while recording:
                         try:
                             data = rec.record(numframes=chunk_size)
-                            # Convert to int16 for level calculation
-                            audio_int16 = (data * 32767).astype(np.int16)
-                            level = np.sqrt(np.mean(audio_int16.astype(float)**2))
+                            level = _rms_level(data)
                             results['mic_chunks'] += 1
                             results['mic_levels'].append(level)
                         except Exception as e:
@@ -95,13 +101,13 @@ def test_concurrent_soundcard_capture():
                     while recording:
                         try:
                             data = rec.record(numframes=chunk_size)
-                            # Convert stereo to mono, then to int16 for level calculation
+                            # Convert stereo to mono (staying in float32) for level calculation
                             if data.ndim == 2:
-                                mono_data = np.mean(data, axis=1)
+                                mono_data = data.sum(axis=1, dtype=np.float32)
+                                mono_data *= np.float32(1.0 / data.shape[1])
                             else:
                                 mono_data = data
-                            audio_int16 = (mono_data * 32767).astype(np.int16)
-                            level = np.sqrt(np.mean(audio_int16.astype(float)**2))
+                            level = _rms_level(mono_data)
                             results['sys_chunks'] += 1
                             results['sys_levels'].append(level)
                         except Exception as e:
@@ -7,6 +7,7 @@ Centralized theme management with persistence and professional styling
 import customtkinter as ctk
 import json
 import os
+import weakref
 from pathlib import Path
 from logger_config import get_logger
 from typing import Optional, Callable, Dict, Any
@@ -17,7 +18,7 @@ class ThemeManager:
     def __init__(self):
         self.logger = get_logger('theme_manager')
         self.config_file = Path("theme_config.json")
-        self.theme_callbacks = []  # Callbacks to update UI when theme changes
+        self.theme_callbacks = []  # References to callbacks that update UI when theme changes
 
         # Professional color themes
         self.professional_themes = {
@@ -133,17 +134,30 @@ class ThemeManager:
         return {}
 
     def register_theme_callback(self, callback: Callable[[str, Dict[str, Any]], None]):
-        """Register callback to be notified when theme changes"""
-        self.theme_callbacks.append(callback)
+        """Register callback to be notified when theme changes
+
+        Bound methods are held weakly so a window that is never unregistered
+        does not stay alive (or keep being called) after it is gone.
+        """
+        if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback
+        self.theme_callbacks.append(ref)
 
     def unregister_theme_callback(self, callback: Callable[[str, Dict[str, Any]], None]):
         """Unregister theme change callback"""
-        if callback in self.theme_callbacks:
-            self.theme_callbacks.remove(callback)
+        self.theme_callbacks = [ref for ref in self.theme_callbacks if ref() not in (None, callback)]
 
     def notify_theme_change(self, theme: str, theme_config: Dict[str, Any]):
         """Notify all registered callbacks about theme change"""
-        for callback in self.theme_callbacks:
+        # Drop callbacks whose owners have been garbage collected
+        live = [(ref, ref()) for ref in self.theme_callbacks]
+        self.theme_callbacks = [ref for ref, callback in live if callback is not None]
+
+        for _, callback in live:
+            if callback is None:
+                continue
             try:
                 callback(theme, theme_config)
             except Exception as e:
@@ -230,10 +244,13 @@ def get_theme_manager() -> ThemeManager:
         _theme_manager = ThemeManager()
     return _theme_manager
 
-def apply_professional_styling(widget, widget_type: str = "default"):
-    """Apply professional styling to a widget based on current theme"""
-    theme_manager = get_theme_manager()
-    colors = theme_manager.get_theme_colors()
+def apply_professional_styling(widget, widget_type: str = "default", colors: Optional[Dict[str, str]] = None):
+    """Apply professional styling to a widget based on current theme
+
+    Callers styling many widgets can pass the theme colors once via ``colors``.
+    """
+    if colors is None:
+        colors = get_theme_manager().get_theme_colors()
 
     if not colors:
         return
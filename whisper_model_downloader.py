@@ -8,11 +8,27 @@ import threading
 import os
 import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 from typing import Dict, Callable, Optional
 from hardware_detector import HardwareDetector
 import tempfile
 import platform
+import json
+
+# Parallel download tuning
+DOWNLOAD_STREAMS = 4
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+PROGRESS_TICK_MS = 100
+
+# Shared HTTP session so range requests and retries reuse pooled TLS connections
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+))
 
 class ModelDownloadDialog:
     """CustomTkinter dialog for downloading Whisper models"""
@@ -22,9 +38,17 @@ class ModelDownloadDialog:
         self.on_complete = on_complete
         self.hardware_detector = HardwareDetector()
         self.download_thread = None
-        self.download_cancelled = False
         self.download_paused = False
 
+        # Shared state for the download streams
+        self._cancel_event = threading.Event()
+        self._dl_lock = threading.Lock()
+        self._dl_active = False
+        self._dl_total = 0
+        self._dl_done = 0
+        self._dl_resumed = 0
+        self._dl_start = 0.0
+
         # Model download URLs (Hugging Face)
         self.model_urls = {
             'tiny': 'https://huggingface.co/openai/whisper-tiny/resolve/main/pytorch_model.bin',
@@ -248,7 +272,7 @@ class ModelDownloadDialog:
         if self.download_thread and self.download_thread.is_alive():
             return
 
-        self.download_cancelled = False
+        self._cancel_event.clear()
         self.download_paused = False
 
         # Update UI for download state
@@ -277,53 +301,188 @@ class ModelDownloadDialog:
             # Download file
             model_path = os.path.join(models_dir, f"{model_name}.bin")
 
-            # Start download with progress tracking
-            response = requests.get(url, stream=True, timeout=30)
+            # Progress is polled from the UI thread while the streams run
+            self._dl_active = True
+            self.window.after(0, self._tick_progress)
+            try:
+                completed = self._parallel_download(url, model_path)
+            finally:
+                self._dl_active = False
+
+            if not completed:
+                self._update_progress("Download cancelled", 0, "")
+                return
+
+            # Download complete
+            self._update_progress("Download completed successfully!", 1.0, "")
+
+            # Wait a moment then close
+            time.sleep(1)
+            self.window.after(0, self._download_complete)
+
+        except Exception as e:
+            error_msg = f"Download failed: {str(e)}"
+            self._update_progress(error_msg, 0, "")
+            self.window.after(0, self._download_failed)
+
+    def _parallel_download(self, url: str, dest: str, num_streams: int = DOWNLOAD_STREAMS) -> bool:
+        """Download url to dest over parallel HTTP range requests.
+
+        Data is written into dest + '.part' and per-stream progress is kept in
+        dest + '.part.json', so a cancelled or failed download resumes where it
+        stopped. Returns False if the download was cancelled.
+        """
+        head = _SESSION.head(url, allow_redirects=True, timeout=30)
+        head.raise_for_status()
+
+        total_size = int(head.headers.get('content-length', 0))
+        part_path = dest + '.part'
+        state_path = part_path + '.json'
+
+        if total_size <= 0 or head.headers.get('accept-ranges', '').lower() != 'bytes':
+            # Server can't serve ranges - fall back to a single stream
+            return self._single_stream_download(url, dest, part_path)
+
+        # Split the file into one contiguous range per stream
+        step = -(-total_size // num_streams)
+        ranges = [(lo, min(lo + step, total_size) - 1) for lo in range(0, total_size, step)]
+
+        done = self._load_resume_state(state_path, part_path, total_size, len(ranges))
+        if done is None:
+            done = [0] * len(ranges)
+            with open(part_path, 'wb') as f:
+                f.truncate(total_size)
+
+        with self._dl_lock:
+            self._dl_total = total_size
+            self._dl_done = self._dl_resumed = sum(done)
+            self._dl_start = time.time()
+
+        errors = []
+        streams = [
+            threading.Thread(
+                target=self._download_range,
+                args=(url, part_path, lo + done[i], hi, i, done, errors),
+                daemon=True
+            )
+            for i, (lo, hi) in enumerate(ranges)
+            if lo + done[i] <= hi
+        ]
+        for stream in streams:
+            stream.start()
+        for stream in streams:
+            stream.join()
+
+        if errors or self._cancel_event.is_set():
+            # Keep the partial file so the next attempt can resume
+            with open(state_path, 'w') as f:
+                json.dump({'size': total_size, 'done': done}, f)
+            if errors:
+                raise errors[0]
+            return False
+
+        os.replace(part_path, dest)
+        try:
+            os.remove(state_path)
+        except FileNotFoundError:
+            pass
+        return True
+
+    def _download_range(self, url: str, part_path: str, start: int, end: int,
+                        index: int, done: list, errors: list):
+        """Fetch bytes start..end of url into the matching slice of part_path"""
+        try:
+            headers = {'Range': f'bytes={start}-{end}'}
+            with _SESSION.get(url, headers=headers, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise RuntimeError("Server ignored range request")
+
+                with open(part_path, 'r+b') as f:
+                    f.seek(start)
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if self._cancel_event.is_set():
+                            return
+                        if chunk:
+                            f.write(chunk)
+                            with self._dl_lock:
+                                done[index] += len(chunk)
+                                self._dl_done += len(chunk)
+        except Exception as e:
+            errors.append(e)
+            # Stop the other streams; the whole download is retried later
+            self._cancel_event.set()
+
+    def _single_stream_download(self, url: str, dest: str, part_path: str) -> bool:
+        """Download url to dest over one connection (no resume)"""
+        with _SESSION.get(url, stream=True, timeout=30) as response:
             response.raise_for_status()
 
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            start_time = time.time()
+            with self._dl_lock:
+                self._dl_total = int(response.headers.get('content-length', 0))
+                self._dl_done = self._dl_resumed = 0
+                self._dl_start = time.time()
 
-            with open(model_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if self.download_cancelled:
+            with open(part_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if self._cancel_event.is_set():
                         f.close()
                         try:
-                            os.remove(model_path)
+                            os.remove(part_path)
                         except:
                             pass
-                        self._update_progress("Download cancelled", 0, "")
-                        return
+                        return False
 
                     if chunk:
                         f.write(chunk)
-                        downloaded += len(chunk)
+                        with self._dl_lock:
+                            self._dl_done += len(chunk)
 
-                        # Update progress
-                        if total_size > 0:
-                            progress = downloaded / total_size
-                            elapsed = time.time() - start_time
-                            if elapsed > 0:
-                                speed = downloaded / elapsed / 1024 / 1024  # MB/s
-                                eta = (total_size - downloaded) / (downloaded / elapsed) if downloaded > 0 else 0
+        os.replace(part_path, dest)
+        return True
 
-                                progress_text = f"Downloading... {downloaded // 1024 // 1024}MB / {total_size // 1024 // 1024}MB"
-                                speed_text = f"Speed: {speed:.1f} MB/s    ETA: {int(eta)} seconds"
+    def _load_resume_state(self, state_path: str, part_path: str, total_size: int, num_ranges: int):
+        """Return per-stream completed byte counts from a previous attempt, or None"""
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+            if (state.get('size') == total_size and len(state.get('done', ())) == num_ranges
+                    and os.path.getsize(part_path) == total_size):
+                return [int(n) for n in state['done']]
+        except (OSError, ValueError, TypeError):
+            pass
+        return None
 
-                                self._update_progress(progress_text, progress, speed_text)
+    def _tick_progress(self):
+        """Refresh progress widgets from the shared counters (UI thread, polled)"""
+        if not self._dl_active:
+            return
 
-            # Download complete
-            self._update_progress("Download completed successfully!", 1.0, "")
+        with self._dl_lock:
+            downloaded = self._dl_done
+            resumed = self._dl_resumed
+            total_size = self._dl_total
+            start_time = self._dl_start
 
-            # Wait a moment then close
-            time.sleep(1)
-            self.window.after(0, self._download_complete)
+        try:
+            if total_size > 0:
+                elapsed = time.time() - start_time
+                fetched = downloaded - resumed
+                if elapsed > 0 and fetched > 0:
+                    rate = fetched / elapsed
+                    speed = rate / 1024 / 1024  # MB/s
+                    eta = (total_size - downloaded) / rate
+
+                    self.progress_label.configure(
+                        text=f"Downloading... {downloaded // 1024 // 1024}MB / {total_size // 1024 // 1024}MB"
+                    )
+                    self.progress_bar.set(downloaded / total_size)
+                    self.speed_label.configure(text=f"Speed: {speed:.1f} MB/s    ETA: {int(eta)} seconds")
 
-        except Exception as e:
-            error_msg = f"Download failed: {str(e)}"
-            self._update_progress(error_msg, 0, "")
-            self.window.after(0, self._download_failed)
+            self.window.after(PROGRESS_TICK_MS, self._tick_progress)
+        except Exception:
+            # Dialog was closed while downloading
+            pass
 
     def _update_progress(self, message: str, progress: float, speed: str):
         """Update progress display (thread-safe)"""
@@ -348,7 +507,7 @@ class ModelDownloadDialog:
     def on_cancel(self):
         """Handle cancel/close"""
         if self.download_thread and self.download_thread.is_alive():
-            self.download_cancelled = True
+            self._cancel_event.set()
             # Wait briefly for thread to cleanup
             self.window.after(1000, self.window.destroy)
         else:
@@ -364,9 +523,46 @@ class WhisperModelManager:
         self.models_dir = os.path.join(os.path.dirname(__file__), "whisper_models")
         os.makedirs(self.models_dir, exist_ok=True)
 
+        # model name -> (cache dir stamp, installed); each miss costs a full local model load
+        self._installed_cache = {}
+        self._installed_lock = threading.Lock()
+
         self.logger.info(f"WhisperModelManager initialized with models dir: {self.models_dir}")
 
+    def _cache_dirs_stamp(self) -> tuple:
+        """mtimes of the dirs models are stored in; a new or removed model folder changes them"""
+        hf_hub = os.environ.get('HF_HUB_CACHE') or os.path.join(
+            os.environ.get('HF_HOME') or os.path.join(
+                os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'huggingface'
+            ),
+            'hub'
+        )
+        stamp = []
+        for path in (self.models_dir, hf_hub):
+            try:
+                stamp.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def _clear_installed_cache(self):
+        with self._installed_lock:
+            self._installed_cache.clear()
+
     def is_model_installed(self, model_name: str) -> bool:
+        """Check if a model is installed (memoized until a model directory changes)"""
+        stamp = self._cache_dirs_stamp()
+        with self._installed_lock:
+            cached = self._installed_cache.get(model_name)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        installed = self._probe_model_installed(model_name)
+        with self._installed_lock:
+            self._installed_cache[model_name] = (stamp, installed)
+        return installed
+
+    def _probe_model_installed(self, model_name: str) -> bool:
         """Check if a model is installed by attempting to load it"""
         try:
             from faster_whisper import WhisperModel
@@ -451,6 +647,7 @@ class WhisperModelManager:
             model_path = self.get_model_path(model_name)
             if os.path.exists(model_path):
                 os.remove(model_path)
+                self._clear_installed_cache()
                 self.logger.info(f"Deleted model: {model_name}")
                 return True
             else:
@@ -585,6 +782,8 @@ class WhisperModelManager:
                     elif 'HF_HOME' in os.environ:
                         del os.environ['HF_HOME']
 
+                # Snapshot completion inside an existing cache folder doesn't touch the dir stamp
+                self._clear_installed_cache()
                 self.logger.info(f"Model {model_name} downloaded and verified successfully")
 
                 if progress_callback: